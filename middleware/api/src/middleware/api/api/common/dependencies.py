@@ -1,8 +1,9 @@
 """Common API components shared across versions."""
 
+import functools
 import logging
 from http import HTTPStatus
-from typing import cast
+from typing import Final, cast
 from urllib.parse import unquote
 
 from asn1crypto.core import SequenceOf, UTF8String  # type: ignore
@@ -21,6 +22,20 @@ logger = logging.getLogger(__name__)
 # Sentinel used to distinguish "cert not yet cached" from "cert cached as None"
 _CERT_NOT_CACHED = object()
 
+# Bounded so that rotating (or hostile) certificates cannot grow memory without limit.
+_CLIENT_CERT_CACHE_SIZE: Final = 1024
+
+
+@functools.lru_cache(maxsize=_CLIENT_CERT_CACHE_SIZE)
+def _load_client_cert(cert_header: str) -> x509.Certificate:
+    """Parse the URL-escaped PEM certificate forwarded by the ingress.
+
+    A client presents the same certificate on every request, so parsed
+    certificates are cached by raw header value. Parse errors propagate and
+    are not cached.
+    """
+    return x509.load_pem_x509_certificate(unquote(cert_header).encode("utf-8"))
+
 
 class _RDISequence(SequenceOf):
     """ASN.1 sequence wrapper for RDI UTF8String entries."""
@@ -28,6 +43,35 @@ class _RDISequence(SequenceOf):
     _child_spec = UTF8String
 
 
+@functools.lru_cache(maxsize=_CLIENT_CERT_CACHE_SIZE)
+def _common_name(cert: x509.Certificate) -> str | None:
+    """Return the subject CN of a cached client certificate, or None if absent."""
+    cn_attributes = cert.subject.get_attributes_for_oid(NameOID.COMMON_NAME)
+    if not cn_attributes:
+        return None
+    return cast(str, cn_attributes[0].value)
+
+
+@functools.lru_cache(maxsize=_CLIENT_CERT_CACHE_SIZE)
+def _allowed_rdis(cert: x509.Certificate, oid: x509.ObjectIdentifier) -> tuple[str, ...]:
+    """Return the RDIs granted by the *oid* extension of a cached client certificate.
+
+    Keyed by the certificate object that ``_load_client_cert`` hands out, so
+    the extension walk and ASN.1 decode run once per certificate. The result
+    is a tuple so callers cannot mutate the cached value.
+    """
+    try:
+        # cryptography parses extensions lazily, so a malformed one raises ValueError here.
+        ext = cert.extensions.get_extension_for_oid(oid)
+        seq = _RDISequence.load(ext.value.public_bytes())
+        return tuple(item.native for item in seq)
+    except ExtensionNotFound:
+        return ()
+    except (TypeError, ValueError) as e:
+        logger.warning("Error extracting RDI extension: %s", e)
+        return ()
+
+
 class CommonApiDependencies:
     """Shared dependencies and helpers for all API versions."""
 
@@ -45,12 +89,8 @@ class CommonApiDependencies:
         # "not yet checked", avoiding redundant header parsing on repeat calls.
         state_cert = getattr(request.state, "cert", _CERT_NOT_CACHED)
         if state_cert is not _CERT_NOT_CACHED:
-            if isinstance(state_cert, x509.Certificate):
-                return state_cert
-            if state_cert is None:
-                return None
-            # Fallback for mocks/tests
-            return cast(x509.Certificate, state_cert)
+            # Only this method writes request.state.cert, so the type is known.
+            return cast(x509.Certificate | None, state_cert)
 
         headers = request.headers
         client_cert = headers.get("ssl-client-cert") or headers.get("X-SSL-Client-Cert")
@@ -68,8 +108,7 @@ class CommonApiDependencies:
             )
 
         try:
-            cert_pem = unquote(client_cert)
-            cert = x509.load_pem_x509_certificate(cert_pem.encode("utf-8"))
+            cert = _load_client_cert(client_cert)
         except (ValueError, TypeError) as e:
             raise HTTPException(
                 status_code=HTTPStatus.BAD_REQUEST, detail=f"Certificate parsing error: {str(e)}"
@@ -84,28 +123,11 @@ class CommonApiDependencies:
         if cert is None:
             return None
 
-        cn_attributes = cert.subject.get_attributes_for_oid(NameOID.COMMON_NAME)
-        if not cn_attributes:
+        common_name = _common_name(cert)
+        if common_name is None:
             raise HTTPException(status_code=HTTPStatus.BAD_REQUEST, detail="Certificate subject does not contain CN")
 
-        return cast(str, cn_attributes[0].value)
-
-    @classmethod
-    async def validate_content_type(cls, request: Request) -> None:
-        """Validate that the content-type is application/json."""
-        if request.method in {"POST", "PUT", "PATCH"}:
-            content_type = request.headers.get("content-type")
-            if not content_type or "application/json" not in content_type:
-                raise HTTPException(
-                    status_code=HTTPStatus.UNSUPPORTED_MEDIA_TYPE, detail="Content-Type must be application/json"
-                )
-
-    @classmethod
-    async def validate_accept_type(cls, request: Request) -> None:
-        """Validate that the accept header is application/json."""
-        accept = request.headers.get("accept")
-        if accept and "*/*" not in accept and "application/json" not in accept:
-            raise HTTPException(status_code=HTTPStatus.NOT_ACCEPTABLE, detail="Accept must be application/json")
+        return common_name
 
     def get_known_rdis(self) -> list[str]:
         """Return the list of known RDIs."""
@@ -120,20 +142,7 @@ class CommonApiDependencies:
         if cert is None:
             return []
 
-        allowed_rdis = []
-        oid = self.config.client_auth_oid
-        try:
-            for ext in cert.extensions:
-                if ext.oid == oid:
-                    der_bytes = ext.value.public_bytes()
-                    seq = _RDISequence.load(der_bytes)
-                    for item in seq:
-                        allowed_rdis.append(item.native)
-                    break
-        except (ExtensionNotFound, TypeError, ValueError) as e:
-            logger.warning("Error extracting RDI extension: %s", e)
-
-        return allowed_rdis
+        return list(_allowed_rdis(cert, self.config.client_auth_oid))
 
     async def validate_rdi_authorized(self, rdi: str, request: Request) -> str:
         """Verify that the client is authorized for the given RDI."""
@@ -155,47 +164,27 @@ async def get_client_id(request: Request) -> str | None:
     return await deps.validate_client_id(request)
 
 
-async def get_content_type(request: Request) -> None:
-    """Dependency helper to validate content type."""
-    deps: CommonApiDependencies = request.app.state.common_deps
-    await deps.validate_content_type(request)
-
-
-async def get_accept_type(request: Request) -> None:
-    """Dependency helper to validate accept type."""
-    deps: CommonApiDependencies = request.app.state.common_deps
-    await deps.validate_accept_type(request)
-
+async def get_business_logic(request: Request) -> BusinessLogic:
+    """Dependency to get BusinessLogic from the app state.
 
-def get_business_logic(request: Request) -> BusinessLogic:
-    """Dependency to get BusinessLogic from the app state."""
-    bl = request.app.state.business_logic
-    if isinstance(bl, BusinessLogic):
-        return bl
-    # Fallback to cast for mocks/tests without spec
-    return cast(BusinessLogic, bl)
+    The app-state getters are ``async`` although they never await: FastAPI
+    runs plain ``def`` dependencies in the threadpool, which would cost a
+    thread hand-off per dependency on every request. The state is typed by
+    ``Api``, so the value is returned as-is without a runtime type check.
+    """
+    return cast(BusinessLogic, request.app.state.business_logic)
 
 
-def get_common_deps(request: Request) -> CommonApiDependencies:
+async def get_common_deps(request: Request) -> CommonApiDependencies:
     """Dependency to get CommonApiDependencies from the app state."""
-    deps = request.app.state.common_deps
-    if isinstance(deps, CommonApiDependencies):
-        return deps
-    # Fallback for mocks/tests
-    return cast(CommonApiDependencies, deps)
+    return cast(CommonApiDependencies, request.app.state.common_deps)
 
 
-def get_health_service(request: Request) -> ApiHealthService:
+async def get_health_service(request: Request) -> ApiHealthService:
     """Dependency to get ApiHealthService from app state."""
-    service = request.app.state.health_service
-    if isinstance(service, ApiHealthService):
-        return service
-    return cast(ApiHealthService, service)
+    return cast(ApiHealthService, request.app.state.health_service)
 
 
-def get_task_status_store(request: Request) -> LegacyTaskStatusStore:
+async def get_task_status_store(request: Request) -> LegacyTaskStatusStore:
     """Dependency to get legacy task status store from app state."""
-    store = request.app.state.task_status_store
-    if isinstance(store, LegacyTaskStatusStore):
-        return store
-    return cast(LegacyTaskStatusStore, store)
+    return cast(LegacyTaskStatusStore, request.app.state.task_status_store)
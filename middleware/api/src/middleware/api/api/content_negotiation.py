@@ -0,0 +1,105 @@
+"""Accept / Content-Type validation as pure ASGI middleware."""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Iterable
+from http import HTTPStatus
+from typing import Final
+
+from starlette.responses import Response
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+# The only media type the API produces and consumes.
+SUPPORTED_MEDIA_TYPE: Final = "application/json"
+_MEDIA_TYPE_BYTES: Final = SUPPORTED_MEDIA_TYPE.encode("latin-1")
+
+# Methods whose request body must be JSON.
+_BODY_METHODS: Final[frozenset[str]] = frozenset({"POST", "PUT", "PATCH"})
+
+# Rejection bodies are constant, so they are encoded once. The responses themselves are built
+# per request: ASGI middleware (e.g. OpenTelemetry) may append to the header list in place.
+_NOT_ACCEPTABLE_BODY: Final = json.dumps(
+    {"detail": f"Accept must be {SUPPORTED_MEDIA_TYPE}"}, separators=(",", ":")
+).encode()
+_UNSUPPORTED_MEDIA_TYPE_BODY: Final = json.dumps(
+    {"detail": f"Content-Type must be {SUPPORTED_MEDIA_TYPE}"}, separators=(",", ":")
+).encode()
+
+
+def scan_headers(raw_headers: Iterable[tuple[bytes, bytes]]) -> tuple[bytes | None, bytes | None, bool]:
+    """Return ``Accept``, ``Content-Type`` and body presence from raw ASGI headers.
+
+    ASGI servers deliver header names lowercased, so a single pass with byte
+    comparisons replaces several case-insensitive ``Headers`` lookups. A body
+    is present if ``Content-Length`` is non-zero or ``Transfer-Encoding`` is set.
+    """
+    accept: bytes | None = None
+    content_type: bytes | None = None
+    has_body = False
+    for name, value in raw_headers:
+        if name == b"accept":
+            accept = value
+        elif name == b"content-type":
+            content_type = value
+        elif name == b"transfer-encoding" or (name == b"content-length" and value != b"0"):
+            has_body = True
+    return accept, content_type, has_body
+
+
+def is_acceptable(accept: bytes | None) -> bool:
+    """Return whether an ``Accept`` header value allows a JSON response."""
+    return not accept or b"*/*" in accept or _MEDIA_TYPE_BYTES in accept
+
+
+def has_json_body(content_type: bytes | None, *, has_body: bool) -> bool:
+    """Return whether a request body, if any, is declared as JSON.
+
+    Requests without a body pass, so body-less trigger endpoints such as
+    ``POST /v3/harvests/{id}/complete`` need no ``Content-Type``.
+    """
+    return not has_body or (content_type is not None and _MEDIA_TYPE_BYTES in content_type)
+
+
+async def _reject(status: HTTPStatus, body: bytes, scope: Scope, receive: Receive, send: Send) -> None:
+    """Send a JSON error response with a freshly built header list."""
+    await Response(content=body, status_code=status, media_type=SUPPORTED_MEDIA_TYPE)(scope, receive, send)
+
+
+class ContentNegotiationMiddleware:
+    """Reject requests the JSON API cannot serve before they reach routing.
+
+    * ``406 Not Acceptable`` if ``Accept`` excludes ``application/json``.
+    * ``415 Unsupported Media Type`` if a POST/PUT/PATCH body is not JSON.
+
+    Running as plain ASGI avoids building a ``Request`` and resolving two
+    FastAPI dependencies for every call. Paths in *exempt_paths* (interactive
+    docs, OpenAPI schema) are passed through unchecked because they serve HTML.
+    """
+
+    def __init__(self, app: ASGIApp, *, exempt_paths: Iterable[str] = ()) -> None:
+        """Initialize middleware.
+
+        Args:
+            app: Downstream ASGI application.
+            exempt_paths: Paths that bypass the checks.
+        """
+        self.app = app
+        self._exempt_paths = frozenset(exempt_paths)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """ASGI entry point."""
+        if scope["type"] != "http" or scope.get("path", "") in self._exempt_paths:
+            await self.app(scope, receive, send)
+            return
+
+        accept, content_type, has_body = scan_headers(scope["headers"])
+        if not is_acceptable(accept):
+            await _reject(HTTPStatus.NOT_ACCEPTABLE, _NOT_ACCEPTABLE_BODY, scope, receive, send)
+            return
+
+        if scope.get("method") in _BODY_METHODS and not has_json_body(content_type, has_body=has_body):
+            await _reject(HTTPStatus.UNSUPPORTED_MEDIA_TYPE, _UNSUPPORTED_MEDIA_TYPE_BODY, scope, receive, send)
+            return
+
+        await self.app(scope, receive, send)
@@ -37,6 +37,7 @@ from ..config import Config
 from ..health_service import ApiHealthService
 from .admission_control import AdmissionControlMiddleware
 from .common.dependencies import CommonApiDependencies
+from .content_negotiation import ContentNegotiationMiddleware
 from .legacy.task_status_store import LegacyTaskStatusStore
 from .tracing import setup_api_tracing
 from .v1 import arcs as arcs_v1, system as system_v1, tasks as tasks_v1
@@ -133,10 +134,6 @@ class Api:
     FastAPI endpoints.
     """
 
-    # Constants
-    SUPPORTED_CONTENT_TYPE = "application/json"
-    SUPPORTED_ACCEPT_TYPE = "application/json"
-
     def __init__(self, app_config: Config) -> None:
         """Initialize the API with optional configuration.
 
@@ -199,25 +196,18 @@ class Api:
                     except (RuntimeError, ValueError, OSError) as exc:
                         logger.warning("Failed to shutdown logger provider: %s", exc)
 
+        docs_enabled = self._config.api_docs_enabled
         self._app = FastAPI(
             title="FAIR Middleware API",
             description="API for managing ARC (Advanced Research Context) objects",
             version=__version__,
             lifespan=lifespan,
+            docs_url="/docs" if docs_enabled else None,
+            redoc_url="/redoc" if docs_enabled else None,
+            openapi_url="/openapi.json" if docs_enabled else None,
         )
 
-        max_concurrent = self._config.max_concurrent_requests
-        if max_concurrent is not None and max_concurrent > 0:
-            self._app.add_middleware(
-                AdmissionControlMiddleware,
-                max_concurrent_requests=max_concurrent,
-                retry_after_seconds=self._config.retry_after_seconds,
-            )
-            logger.info(
-                "Admission control enabled: max_concurrent_requests=%d retry_after_seconds=1..%d (jittered)",
-                max_concurrent,
-                self._config.retry_after_seconds,
-            )
+        self._setup_middleware()
 
         # Initialize OpenTelemetry tracing and logging
         _tracing = setup_api_tracing(self._app, self._config)
@@ -238,6 +228,37 @@ class Api:
         """Configured FastAPI application instance."""
         return self._app
 
+    def _setup_middleware(self) -> None:
+        """Register ASGI middleware (the last one added runs outermost)."""
+        max_concurrent = self._config.max_concurrent_requests
+        if max_concurrent is not None and max_concurrent > 0:
+            self._app.add_middleware(
+                AdmissionControlMiddleware,
+                max_concurrent_requests=max_concurrent,
+                retry_after_seconds=self._config.retry_after_seconds,
+            )
+            logger.info(
+                "Admission control enabled: max_concurrent_requests=%d retry_after_seconds=1..%d (jittered)",
+                max_concurrent,
+                self._config.retry_after_seconds,
+            )
+
+        # Added last so it is outermost: requests the JSON API cannot serve are
+        # rejected before they occupy an admission slot.
+        self._app.add_middleware(
+            ContentNegotiationMiddleware,
+            exempt_paths=[
+                url
+                for url in (
+                    self._app.docs_url,
+                    self._app.redoc_url,
+                    self._app.openapi_url,
+                    self._app.swagger_ui_oauth2_redirect_url,
+                )
+                if url
+            ],
+        )
+
     def _setup_exception_handlers(self) -> None:
         @self._app.exception_handler(InvalidJsonSemanticError)
         async def invalid_json_semantic_handler(_request: Request, exc: InvalidJsonSemanticError) -> JSONResponse:
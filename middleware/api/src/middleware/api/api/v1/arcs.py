@@ -9,11 +9,9 @@ from fastapi import APIRouter, Depends, HTTPException, Request
 
 from middleware.api.api.common.dependencies import (
     CommonApiDependencies,
-    get_accept_type,
     get_business_logic,
     get_client_id,
     get_common_deps,
-    get_content_type,
     get_task_status_store,
 )
 from middleware.api.business_logic import ArcOperationResult, BusinessLogic
@@ -31,8 +29,6 @@ async def create_or_update_arcs(
     bl: Annotated[BusinessLogic, Depends(get_business_logic)],
     deps: Annotated[CommonApiDependencies, Depends(get_common_deps)],
     client_id: Annotated[str | None, Depends(get_client_id)],
-    _: Annotated[None, Depends(get_content_type)],
-    __: Annotated[None, Depends(get_accept_type)],
 ) -> v1_models.CreateOrUpdateArcsResponse:
     """Submit ARCs for processing asynchronously (v1)."""
     rdi = request_body.rdi
@@ -48,7 +44,7 @@ async def create_or_update_arcs(
 
     task_id = str(uuid.uuid4())
     if isinstance(result, ArcOperationResult):
-        task_status_store = get_task_status_store(request)
+        task_status_store = await get_task_status_store(request)
         try:
             await task_status_store.store_task_result(task_id, result)
         except (TimeoutError, RuntimeError, ValueError, OSError) as exc:
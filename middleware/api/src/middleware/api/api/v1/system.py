@@ -2,13 +2,12 @@
 
 import logging
 from http import HTTPStatus
-from typing import Annotated
+from typing import Annotated, Final
 
 from fastapi import APIRouter, Depends, Request, Response
 
 from middleware.api.api.common.dependencies import (
     CommonApiDependencies,
-    get_accept_type,
     get_business_logic,
     get_client_id,
     get_common_deps,
@@ -20,13 +19,15 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/v1", tags=["v1", "system"], deprecated=True)
 
+# The liveness payload never changes; serialize it once at import time.
+_LIVENESS_BODY: Final[bytes] = v1_models.LivenessResponse().model_dump_json().encode()
+
 
 @router.get("/whoami", response_model=v1_models.WhoamiResponse)
 async def whoami(
     request: Request,
     deps: Annotated[CommonApiDependencies, Depends(get_common_deps)],
     client_id: Annotated[str | None, Depends(get_client_id)],
-    _: Annotated[None, Depends(get_accept_type)],
 ) -> v1_models.WhoamiResponse:
     """Identify the current client and authorized RDIs."""
     authorized_rdis = await deps.get_authorized_rdis(request)
@@ -41,18 +42,15 @@ async def whoami(
 
 
 @router.get("/liveness", response_model=v1_models.LivenessResponse)
-async def liveness(
-    _: Annotated[None, Depends(get_accept_type)],
-) -> v1_models.LivenessResponse:
+async def liveness() -> Response:
     """Perform a simple liveness check."""
-    return v1_models.LivenessResponse()
+    return Response(content=_LIVENESS_BODY, media_type="application/json")
 
 
 @router.get("/health", response_model=v1_models.HealthResponse)
 async def health_check(
     response: Response,
     bl: Annotated[BusinessLogic, Depends(get_business_logic)],
-    _: Annotated[None, Depends(get_accept_type)],
 ) -> v1_models.HealthResponse:
     """Detailed health check for v1."""
     services = await bl.health_check()
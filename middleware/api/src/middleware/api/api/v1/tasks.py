@@ -7,7 +7,6 @@ from fastapi import APIRouter, Depends
 from pydantic import ValidationError
 
 from middleware.api.api.common.dependencies import (
-    get_accept_type,
     get_task_status_store,
 )
 from middleware.api.api.legacy.task_status_store import LegacyTaskStatusStore
@@ -24,7 +23,6 @@ router = APIRouter(prefix="/v1/tasks", tags=["v1", "tasks"], deprecated=True)
 async def get_task_status(
     task_id: str,
     task_status_store: Annotated[LegacyTaskStatusStore, Depends(get_task_status_store)],
-    _: Annotated[None, Depends(get_accept_type)],
 ) -> v1_models.GetTaskStatusResponse:
     """Get the status of an async task (v1)."""
     result = await task_status_store.get_task_status(task_id)
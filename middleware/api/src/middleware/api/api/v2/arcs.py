@@ -9,11 +9,9 @@ from fastapi import APIRouter, Depends, HTTPException, Request
 
 from middleware.api.api.common.dependencies import (
     CommonApiDependencies,
-    get_accept_type,
     get_business_logic,
     get_client_id,
     get_common_deps,
-    get_content_type,
     get_task_status_store,
 )
 from middleware.api.business_logic import ArcOperationResult, BusinessLogic
@@ -32,8 +30,6 @@ async def create_or_update_arc(
     bl: Annotated[BusinessLogic, Depends(get_business_logic)],
     deps: Annotated[CommonApiDependencies, Depends(get_common_deps)],
     client_id: Annotated[str | None, Depends(get_client_id)],
-    _: Annotated[None, Depends(get_content_type)],
-    __: Annotated[None, Depends(get_accept_type)],
 ) -> v2_models.CreateOrUpdateArcResponse:
     """Submit a single ARC for processing asynchronously (v2)."""
     rdi = request_body.rdi
@@ -43,7 +39,7 @@ async def create_or_update_arc(
 
     task_id = str(uuid.uuid4())
     if isinstance(result, ArcOperationResult):
-        task_status_store = get_task_status_store(request)
+        task_status_store = await get_task_status_store(request)
         try:
             await task_status_store.store_task_result(task_id, result)
         except (TimeoutError, RuntimeError, ValueError, OSError) as exc:
@@ -7,7 +7,6 @@ from typing import Annotated
 from fastapi import APIRouter, Depends, Response
 
 from middleware.api.api.common.dependencies import (
-    get_accept_type,
     get_business_logic,
 )
 from middleware.api.business_logic import BusinessLogic
@@ -22,7 +21,6 @@ router = APIRouter(prefix="/v2", tags=["v2", "system"])
 async def health_check_v2(
     response: Response,
     bl: Annotated[BusinessLogic, Depends(get_business_logic)],
-    _: Annotated[None, Depends(get_accept_type)],
 ) -> v2_models.HealthResponse:
     """Detailed health check for v2."""
     services = await bl.health_check()
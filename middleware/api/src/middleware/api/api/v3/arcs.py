@@ -7,11 +7,9 @@ from fastapi import APIRouter, Depends, HTTPException, Request
 
 from middleware.api.api.common.dependencies import (
     CommonApiDependencies,
-    get_accept_type,
     get_business_logic,
     get_client_id,
     get_common_deps,
-    get_content_type,
 )
 from middleware.api.business_logic import BusinessLogic
 from middleware.shared.api_models.v3 import models
@@ -26,8 +24,6 @@ async def create_or_update_arc(
     bl: Annotated[BusinessLogic, Depends(get_business_logic)],
     deps: Annotated[CommonApiDependencies, Depends(get_common_deps)],
     client_id: Annotated[str | None, Depends(get_client_id)],
-    _: Annotated[None, Depends(get_content_type)],
-    __: Annotated[None, Depends(get_accept_type)],
 ) -> models.ArcResponse:
     """Process an ARC and return the result directly."""
     rdi = request_body.rdi
@@ -7,11 +7,9 @@ from fastapi import APIRouter, Depends, HTTPException, Query, Request
 
 from middleware.api.api.common.dependencies import (
     CommonApiDependencies,
-    get_accept_type,
     get_business_logic,
     get_client_id,
     get_common_deps,
-    get_content_type,
 )
 from middleware.api.business_logic import BusinessLogic, ConflictError
 from middleware.api.business_logic.exceptions import DuplicateArcInHarvestError
@@ -22,14 +20,12 @@ router = APIRouter(prefix="/v3/harvests", tags=["v3", "harvests"])
 
 
 @router.post("", response_model=v3_models.HarvestResponse)
-async def create_harvest(  # noqa: PLR0913, PLR0917
+async def create_harvest(
     request: Request,
     request_body: v3_models.CreateHarvestRequest,
     bl: Annotated[BusinessLogic, Depends(get_business_logic)],
     deps: Annotated[CommonApiDependencies, Depends(get_common_deps)],
     client_id: Annotated[str | None, Depends(get_client_id)],
-    _content_type: Annotated[None, Depends(get_content_type)],
-    _accept_type: Annotated[None, Depends(get_accept_type)],
 ) -> v3_models.HarvestResponse:
     """Start a new harvest run."""
     await deps.validate_rdi_authorized(request_body.rdi, request)
@@ -51,7 +47,6 @@ async def list_harvests(  # noqa: PLR0913, PLR0917
     bl: Annotated[BusinessLogic, Depends(get_business_logic)],
     deps: Annotated[CommonApiDependencies, Depends(get_common_deps)],
     _client_id: Annotated[str | None, Depends(get_client_id)],
-    _accept_type: Annotated[None, Depends(get_accept_type)],
     rdi: str | None = None,
     skip: int = Query(default=0, ge=0, description="Number of records to skip"),
     limit: int = Query(default=100, ge=1, le=1000, description="Maximum number of records to return"),
@@ -120,7 +115,6 @@ async def patch_harvest_status(  # noqa: PLR0913, PLR0917
     bl: Annotated[BusinessLogic, Depends(get_business_logic)],
     deps: Annotated[CommonApiDependencies, Depends(get_common_deps)],
     client_id: Annotated[str | None, Depends(get_client_id)],
-    _content_type: Annotated[None, Depends(get_content_type)],
 ) -> v3_models.HarvestResponse:
     """Transition a harvest run to a terminal status (COMPLETED, CANCELLED, or FAILED).
 
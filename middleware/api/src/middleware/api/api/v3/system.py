@@ -5,7 +5,7 @@ from typing import Annotated
 
 from fastapi import APIRouter, Depends, Response
 
-from middleware.api.api.common.dependencies import get_accept_type, get_health_service
+from middleware.api.api.common.dependencies import get_health_service
 from middleware.api.health_service import ApiHealthService
 from middleware.shared.api_models.v3.models import (
     HealthResponse,
@@ -20,7 +20,6 @@ router = APIRouter(prefix="/v3", tags=["v3", "system"])
 @router.get("/liveness", response_model=LivenessResponse)
 async def liveness(
     health_service: Annotated[ApiHealthService, Depends(get_health_service)],
-    _: Annotated[None, Depends(get_accept_type)],
 ) -> LivenessResponse:
     """Return API process liveness status."""
     checks = await health_service.liveness_checks()
@@ -34,7 +33,6 @@ async def liveness(
 async def readiness(
     response: Response,
     health_service: Annotated[ApiHealthService, Depends(get_health_service)],
-    _: Annotated[None, Depends(get_accept_type)],
 ) -> ReadinessResponse:
     """Return API readiness based on direct dependencies."""
     checks = await health_service.readiness_checks()
@@ -53,7 +51,6 @@ async def readiness(
 async def health(
     response: Response,
     health_service: Annotated[ApiHealthService, Depends(get_health_service)],
-    _: Annotated[None, Depends(get_accept_type)],
 ) -> HealthResponse:
     """Return global health for monitoring consumers."""
     checks = await health_service.global_health_checks()
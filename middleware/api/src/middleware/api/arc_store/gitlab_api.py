@@ -11,11 +11,16 @@ import asyncio
 import base64
 import concurrent.futures
 import hashlib
+import http
+import json
 import logging
+import os
 import tempfile
-from collections.abc import Callable
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Iterator
 from pathlib import Path
-from typing import Annotated, Any, TypeVar
+from typing import Annotated, Any, Final, TypeVar
 
 import gitlab
 from arctrl import ARC  # type: ignore[import-untyped]
@@ -23,6 +28,7 @@ from gitlab.exceptions import GitlabGetError
 from gitlab.v4.objects import Project, ProjectFile
 from opentelemetry import context
 from pydantic import BaseModel, Field, HttpUrl, SecretStr, field_validator
+from requests.adapters import DEFAULT_POOLSIZE, HTTPAdapter
 from typing_extensions import deprecated
 
 from . import ArcStore
@@ -31,6 +37,37 @@ logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
 
+# Store metadata files committed next to the ARC; never part of the ARC itself.
+_ARC_HASH_FILE: Final = ".arc_hash"
+_ARC_DIGESTS_FILE: Final = ".arc_hashes.json"
+_METADATA_FILES: Final = frozenset({_ARC_HASH_FILE, _ARC_DIGESTS_FILE})
+
+# Threads in the store-wide hashing pool shared by all concurrent ARC updates.
+_HASH_WORKERS: Final = min(8, os.cpu_count() or 1)
+
+# Most recently used ARC id -> project id mappings kept per store instance.
+_PROJECT_ID_CACHE_SIZE: Final = 1024
+
+
+def _file_digest(file_path: str) -> bytes:
+    """Return the SHA-256 digest of a file, streamed in C."""
+    with open(file_path, "rb") as f:
+        return hashlib.file_digest(f, "sha256").digest()
+
+
+def _walk_files(root: str, prefix: str = "") -> Iterator[tuple[str, str]]:
+    """Yield ``(relative POSIX path, filesystem path)`` for every regular file below *root*.
+
+    ``os.scandir`` reports the entry type from the directory listing itself, so unlike
+    ``Path.rglob`` plus ``is_file`` this needs no ``stat`` call or ``Path`` object per entry.
+    """
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _walk_files(entry.path, f"{prefix}{entry.name}/")
+            elif entry.is_file(follow_symlinks=False):
+                yield f"{prefix}{entry.name}", entry.path
+
 
 @deprecated("GitlabApiConfig is deprecated. Use GitRepoConfig from middleware.api.arc_store.config instead.")
 class GitlabApiConfig(BaseModel):
@@ -63,6 +100,16 @@ class GitlabApiConfig(BaseModel):
             ge=1,
         ),
     ] = 100
+    temp_dir: Annotated[
+        Path | None,
+        Field(
+            description=(
+                "Directory for staging ARC files during create/update and get. Point it at a tmpfs such as "
+                "/dev/shm to avoid disk I/O; every ARC in flight is then held in memory. Defaults to the "
+                "system temp directory"
+            ),
+        ),
+    ] = None
 
     @field_validator("group", mode="before")
     @classmethod
@@ -100,7 +147,20 @@ class GitlabApi(ArcStore):
         logger.info("Initializing ARCPersistenceGitlabAPI")
         self._config = config
         self._gitlab = gitlab.Gitlab(str(self._config.url), private_token=self._config.token.get_secret_value())
+        # Grow the connection pool with the worker threads so they keep their connections alive instead of
+        # discarding them once requests' default pool is exhausted; never shrink it below that default.
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max(self._config.max_workers, DEFAULT_POOLSIZE))
+        self._gitlab.session.mount("https://", adapter)
+        self._gitlab.session.mount("http://", adapter)
         self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=self._config.max_workers)
+        # Separate from self._executor: hashing is submitted from its threads, and waiting on the
+        # same pool could deadlock once all workers are busy.
+        self._hash_executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=_HASH_WORKERS, thread_name_prefix="gitlab-api-hash"
+        )
+        # ARC id -> GitLab project id (LRU); replaces the search request on repeated access.
+        self._project_ids: OrderedDict[str, int] = OrderedDict()
+        self._project_ids_lock = threading.Lock()
 
     async def _run_in_executor(self, func: Callable[..., T], *args: Any) -> T:
         loop = asyncio.get_running_loop()
@@ -115,6 +175,12 @@ class GitlabApi(ArcStore):
 
         return await loop.run_in_executor(self._executor, _wrapper)
 
+    async def shutdown(self) -> None:
+        """Shut down the thread-pool executors, cancelling any pending futures."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._hash_executor.shutdown(wait=False, cancel_futures=True)
+        logger.debug("GitlabApi thread-pool executors shut down")
+
     def _check_health(self) -> bool:
         """Check connection to the storage backend."""
         try:
@@ -132,12 +198,9 @@ class GitlabApi(ArcStore):
             "api.GitlabApi._get_or_create_project",
             attributes={"arc_id": arc_id},
         ):
-            logger.debug("Looking up GitLab project for ARC: %s", arc_id)
-            projects = self._gitlab.projects.list(search=arc_id)
-            for project in projects:
-                if project.path == arc_id:
-                    logger.debug("Found existing project: %s (id=%s)", arc_id, project.id)
-                    return project
+            project = self._find_project(arc_id)
+            if project is not None:
+                return project
             logger.info("Creating new GitLab project for ARC: %s", arc_id)
             group = self._gitlab.groups.get(self._config.group)
             new_project = self._gitlab.projects.create({
@@ -147,6 +210,7 @@ class GitlabApi(ArcStore):
                 "initialize_with_readme": False,
             })
             logger.info("Created project: %s (id=%s)", arc_id, new_project.id)
+            self._remember_project_id(arc_id, new_project.id)
             return new_project
 
     def _find_project(self, arc_id: str) -> Project | None:
@@ -154,30 +218,83 @@ class GitlabApi(ArcStore):
             "api.GitlabApi._find_project",
             attributes={"arc_id": arc_id},
         ):
+            cached = self._get_cached_project(arc_id)
+            if cached is not None:
+                return cached
             logger.debug("Searching for GitLab project: %s", arc_id)
             projects = self._gitlab.projects.list(search=arc_id)
             result = next((p for p in projects if p.path == arc_id), None)
             if result:
                 logger.debug("Found project: %s (id=%s)", arc_id, result.id)
+                self._remember_project_id(arc_id, result.id)
             else:
                 logger.debug("Project not found: %s", arc_id)
             return result
 
+    def _get_cached_project(self, arc_id: str) -> Project | None:
+        """Fetch the project by its cached id, evicting the entry if it is gone or renamed.
+
+        A lookup by id is a primary-key GET, much cheaper than a search, and it
+        confirms that the project still exists under this path. Other workers
+        may delete or recreate projects, so a cached id is never trusted blindly.
+        """
+        with self._project_ids_lock:
+            project_id = self._project_ids.get(arc_id)
+            if project_id is None:
+                return None
+            self._project_ids.move_to_end(arc_id)
+        try:
+            project = self._gitlab.projects.get(project_id)
+        except GitlabGetError as e:
+            if e.response_code != http.HTTPStatus.NOT_FOUND:
+                raise
+            project = None
+        if project is None or project.path != arc_id:
+            logger.debug("Cached project id %s for ARC %s is stale", project_id, arc_id)
+            self._forget_project_id(arc_id)
+            return None
+        return project
+
+    def _remember_project_id(self, arc_id: str, project_id: int) -> None:
+        with self._project_ids_lock:
+            self._project_ids[arc_id] = project_id
+            self._project_ids.move_to_end(arc_id)
+            if len(self._project_ids) > _PROJECT_ID_CACHE_SIZE:
+                self._project_ids.popitem(last=False)
+
+    def _forget_project_id(self, arc_id: str) -> None:
+        with self._project_ids_lock:
+            self._project_ids.pop(arc_id, None)
+
     # -------------------------- Hashing --------------------------
+    def _compute_file_digests(self, arc_dir: Path) -> dict[str, str]:
+        """Return the SHA-256 hex digest of every file, keyed by its relative POSIX path."""
+        files = dict(_walk_files(str(arc_dir)))
+        # Leaves are independent and hashlib releases the GIL, so hash them in parallel.
+        digests = self._hash_executor.map(_file_digest, files.values())
+        return dict(zip(files, (d.hex() for d in digests), strict=True))
+
     @staticmethod
-    def _compute_arc_hash(arc_dir: Path) -> str:
+    def _compute_arc_hash(file_digests: dict[str, str]) -> str:
+        """Fold each file's relative path and digest into one ARC hash.
+
+        Keying the fixed-size leaves by path also catches renames that leave the
+        content unchanged.
+        """
         sha = hashlib.sha256()
-        for file_path in sorted(arc_dir.rglob("*")):
-            if file_path.is_file():
-                with open(file_path, "rb") as f:
-                    while chunk := f.read(8192):
-                        sha.update(chunk)
+        for relative_path in sorted(file_digests):
+            sha.update(relative_path.encode("utf-8") + b"\0")
+            sha.update(bytes.fromhex(file_digests[relative_path]))
         return sha.hexdigest()
 
-    def _load_old_hash(self, project: Project) -> str | None:
+    def _load_old_hash(self, project: Project, existing_files: set[str]) -> str | None:
         with self._tracer.start_as_current_span("api.GitlabApi._load_old_hash"):
+            if _ARC_HASH_FILE not in existing_files:
+                # The tree listing already tells us there is nothing to fetch.
+                logger.debug("No existing .arc_hash file found in project")
+                return None
             try:
-                old_hash_file = project.files.get(file_path=".arc_hash", ref=self._config.branch)
+                old_hash_file = project.files.get(file_path=_ARC_HASH_FILE, ref=self._config.branch)
                 old_hash = base64.b64decode(old_hash_file.content).decode("utf-8").strip()
                 logger.debug("Loaded existing ARC hash from GitLab: %s", old_hash[:16])
                 return old_hash
@@ -185,6 +302,19 @@ class GitlabApi(ArcStore):
                 logger.debug("No existing .arc_hash file found in project")
                 return None
 
+    def _load_old_digests(self, project: Project, existing_files: set[str]) -> dict[str, str]:
+        """Load the per-file digests of the last commit; empty if unknown or unreadable."""
+        with self._tracer.start_as_current_span("api.GitlabApi._load_old_digests"):
+            if _ARC_DIGESTS_FILE not in existing_files:
+                return {}
+            try:
+                digests_file = project.files.get(file_path=_ARC_DIGESTS_FILE, ref=self._config.branch)
+                digests = json.loads(base64.b64decode(digests_file.content))
+            except (GitlabGetError, ValueError) as e:
+                logger.warning("Could not load %s, uploading all files: %s", _ARC_DIGESTS_FILE, e)
+                return {}
+            return digests if isinstance(digests, dict) else {}
+
     # -------------------------- File Actions --------------------------
     def _get_existing_files(self, project: Project) -> set[str]:
         """Get all existing file paths in the project with a single API call."""
@@ -203,68 +333,88 @@ class GitlabApi(ArcStore):
                 logger.debug("Branch %s doesn't exist yet (new project)", self._config.branch)
                 return set()
 
-    def _prepare_file_actions(
-        self, project: Project, arc_path: Path, old_hash: str | None, new_hash: str
+    def _prepare_file_actions(  # noqa: PLR0913, PLR0917
+        self,
+        arc_path: Path,
+        existing_files: set[str],
+        file_digests: dict[str, str],
+        old_digests: dict[str, str],
+        old_hash: str | None,
+        new_hash: str,
     ) -> list[dict[str, Any]]:
-        """Prepare file actions with optimized batch file existence check."""
+        """Prepare actions for changed files only, using the per-file digests of the last commit.
+
+        Files whose digest matches ``old_digests`` are skipped, and files recorded
+        there that no longer exist locally are deleted. Without old digests every
+        file is uploaded.
+        """
         with self._tracer.start_as_current_span(
             "api.GitlabApi._prepare_file_actions",
             attributes={"arc_path": str(arc_path)},
         ) as span:
             logger.debug("Preparing file actions for ARC at: %s", arc_path)
-            # Single API call to get all existing files
-            existing_files = self._get_existing_files(project)
             span.set_attribute("existing_files_count", len(existing_files))
 
             actions = []
-            for file_path in arc_path.rglob("*"):
-                if not file_path.is_file():
-                    continue
-                relative_path = str(file_path.relative_to(arc_path))
-                action_type = "update" if relative_path in existing_files else "create"
-                actions.append(self._build_file_action(file_path, relative_path, action_type))
+            for relative_path, digest in file_digests.items():
+                if relative_path in existing_files:
+                    if old_digests.get(relative_path) == digest:
+                        continue
+                    action_type = "update"
+                else:
+                    action_type = "create"
+                actions.append(self._build_file_action(arc_path / relative_path, relative_path, action_type))
+            actions.extend(
+                {"action": "delete", "file_path": relative_path}
+                for relative_path in old_digests.keys() - file_digests.keys()
+                if relative_path in existing_files
+            )
 
             span.set_attribute("actions_count", len(actions))
             logger.debug("Prepared %d file actions (%d existing files)", len(actions), len(existing_files))
 
-            # ARC hash action separat hinzufügen
+            # ARC hash actions separat hinzufügen
             actions.append(self._build_hash_action(old_hash, new_hash))
+            actions.append(self._build_digests_action(_ARC_DIGESTS_FILE in existing_files, file_digests))
             return actions
 
-    def _build_file_action(self, file_path: Path, relative_path: str, action_type: str) -> dict[str, Any]:
+    @classmethod
+    def _build_file_action(cls, file_path: Path, relative_path: str, action_type: str) -> dict[str, Any]:
         """Erstellt ein Action-Dict für eine Datei (Text oder Binär)."""
         content_bytes = file_path.read_bytes()
-        if self._is_text_file(content_bytes):
+        # Decode once: the result doubles as the UTF-8 probe and the text payload.
+        try:
             return {
                 "action": action_type,
                 "file_path": relative_path,
                 "content": content_bytes.decode("utf-8"),
             }
-        return {
-            "action": action_type,
-            "file_path": relative_path,
-            "content": base64.b64encode(content_bytes).decode("utf-8"),
-            "encoding": "base64",
-        }
-
-    @classmethod
-    def _is_text_file(cls, content_bytes: bytes) -> bool:
-        """Gibt True zurück, wenn Datei UTF-8-dekodierbar ist."""
-        try:
-            content_bytes.decode("utf-8")
-            return True
         except UnicodeDecodeError:
-            return False
+            return {
+                "action": action_type,
+                "file_path": relative_path,
+                "content": base64.b64encode(content_bytes).decode("ascii"),
+                "encoding": "base64",
+            }
 
     @classmethod
     def _build_hash_action(cls, old_hash: str | None, new_hash: str) -> dict[str, Any]:
         """Erstellt die Commit-Action für die .arc_hash Datei."""
         return {
             "action": "create" if not old_hash else "update",
-            "file_path": ".arc_hash",
+            "file_path": _ARC_HASH_FILE,
             "content": new_hash,
         }
 
+    @classmethod
+    def _build_digests_action(cls, exists: bool, file_digests: dict[str, str]) -> dict[str, Any]:
+        """Erstellt die Commit-Action für die .arc_hashes.json Datei."""
+        return {
+            "action": "update" if exists else "create",
+            "file_path": _ARC_DIGESTS_FILE,
+            "content": json.dumps(file_digests, indent=2, sort_keys=True),
+        }
+
     # -------------------------- Commit --------------------------
     def _commit_actions(self, project: Project, actions: list[dict[str, Any]], arc_id: str) -> None:
         with self._tracer.start_as_current_span(
@@ -323,39 +473,61 @@ class GitlabApi(ArcStore):
 
         project = await self._run_in_executor(self._get_or_create_project, arc_id)
 
-        with tempfile.TemporaryDirectory() as tmp_root:
+        with tempfile.TemporaryDirectory(dir=self._config.temp_dir) as tmp_root:
             arc_path = Path(tmp_root) / arc_id
             arc_path.mkdir(parents=True, exist_ok=True)
 
-            # arc.Write is not async, run in executor
-            logger.debug("Writing ARC to temporary directory: %s", arc_path)
-            await self._run_in_executor(arc.Write, str(arc_path))
-
-            # Compute hash once with tracing
-            with self._tracer.start_as_current_span("api.GitlabApi._compute_arc_hash"):
-                new_hash = await self._run_in_executor(self._compute_arc_hash, arc_path)
+            # Writing and hashing the ARC locally does not depend on the remote state, so overlap them.
+            # Both must settle before raising, or the writer races the removal of the temp directory.
+            local, remote = await asyncio.gather(
+                self._write_and_digest(arc, arc_path),
+                self._load_remote_state(project),
+                return_exceptions=True,
+            )
+            if isinstance(remote, BaseException):
+                raise remote
+            if isinstance(local, BaseException):
+                raise local
+            file_digests = local
+            existing_files, old_hash = remote
+            new_hash = self._compute_arc_hash(file_digests)
             logger.debug("Computed ARC hash: %s", new_hash[:16])
 
-            old_hash = await self._run_in_executor(self._load_old_hash, project)
-
             if new_hash == old_hash:
                 logger.info("ARC %s unchanged (hash: %s...), skipping commit", arc_id, new_hash[:16])
                 return
 
             logger.debug("ARC %s has changed, preparing commit", arc_id)
-            actions = await self._run_in_executor(self._prepare_file_actions, project, arc_path, old_hash, new_hash)
+            old_digests = await self._run_in_executor(self._load_old_digests, project, existing_files)
+            actions = await self._run_in_executor(
+                self._prepare_file_actions, arc_path, existing_files, file_digests, old_digests, old_hash, new_hash
+            )
             await self._run_in_executor(self._commit_actions, project, actions, arc_id)
 
+    async def _write_and_digest(self, arc: ARC, arc_path: Path) -> dict[str, str]:
+        # arc.Write is not async, run in executor
+        logger.debug("Writing ARC to temporary directory: %s", arc_path)
+        await self._run_in_executor(arc.Write, str(arc_path))
+        with self._tracer.start_as_current_span("api.GitlabApi._compute_arc_hash"):
+            return await self._run_in_executor(self._compute_file_digests, arc_path)
+
+    async def _load_remote_state(self, project: Project) -> tuple[set[str], str | None]:
+        # Single tree listing serves both the .arc_hash lookup and create/update decisions
+        existing_files = await self._run_in_executor(self._get_existing_files, project)
+        old_hash = await self._run_in_executor(self._load_old_hash, project, existing_files)
+        return existing_files, old_hash
+
     # -------------------------- Get --------------------------
     async def _get(self, arc_id: str) -> ARC | None:
-        def _task() -> ARC | None:
-            project = self._find_project(arc_id)
-            if not project:
-                return None
-            with tempfile.TemporaryDirectory() as tmp_root:
-                arc_path = Path(tmp_root) / arc_id
-                arc_path.mkdir(parents=True, exist_ok=True)
-                self._download_project_files(project, arc_path)
+        project = await self._run_in_executor(self._find_project, arc_id)
+        if not project:
+            return None
+        with tempfile.TemporaryDirectory(dir=self._config.temp_dir) as tmp_root:
+            arc_path = Path(tmp_root) / arc_id
+            arc_path.mkdir(parents=True, exist_ok=True)
+            await self._download_project_files(project, arc_path)
+
+            def _load() -> ARC | None:
                 try:
                     return ARC.load(str(arc_path))
                 except FileNotFoundError as e:
@@ -365,17 +537,29 @@ class GitlabApi(ArcStore):
                     logger.error("Unexpected error loading ARC for %s: %s", arc_id, e, exc_info=True)
                     raise
 
-        return await self._run_in_executor(_task)
-
-    def _download_project_files(self, project: Project, arc_path: Path) -> None:
-        tree = project.repository_tree(ref=self._config.branch, all=True, recursive=True)
-        for entry in tree:
-            if entry["type"] != "blob" or entry["path"] == ".arc_hash":
-                continue
-            f = project.files.get(file_path=entry["path"], ref=self._config.branch)
-            file_path = arc_path / entry["path"]
-            file_path.parent.mkdir(parents=True, exist_ok=True)
-            self._write_project_file(f, file_path)
+            return await self._run_in_executor(_load)
+
+    async def _download_project_files(self, project: Project, arc_path: Path) -> None:
+        """Download all ARC files concurrently, bounded by the executor's ``max_workers``."""
+        tree = await self._run_in_executor(
+            lambda: project.repository_tree(ref=self._config.branch, all=True, recursive=True)
+        )
+        paths = [entry["path"] for entry in tree if entry["type"] == "blob" and entry["path"] not in _METADATA_FILES]
+        # Let every download settle before raising: a failing one must not leave the others
+        # writing into a temp directory the caller is already removing.
+        results = await asyncio.gather(
+            *(self._run_in_executor(self._download_project_file, project, path, arc_path) for path in paths),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
+    def _download_project_file(self, project: Project, path: str, arc_path: Path) -> None:
+        f = project.files.get(file_path=path, ref=self._config.branch)
+        file_path = arc_path / path
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        self._write_project_file(f, file_path)
 
     @classmethod
     def _write_project_file(cls, f: ProjectFile, file_path: Path) -> None:
@@ -395,6 +579,7 @@ class GitlabApi(ArcStore):
             project = self._find_project(arc_id)
             if project:
                 project.delete()
+                self._forget_project_id(arc_id)
             else:
                 logger.warning("Project %s not found for deletion.", arc_id)
 
@@ -1,6 +1,5 @@
 """ARC management operations for creating, updating, and syncing ARCs."""
 
-import json
 import logging
 from datetime import UTC, datetime
 from typing import Any
@@ -181,10 +180,10 @@ class ArcManager:
             try:
                 rocrate = parse_rocrate(arc)
                 arc_id = calculate_arc_id(rocrate.identifier, rdi)
-                arc_content = rocrate.model_dump(by_alias=True)
                 span.set_attribute("arc_id", arc_id)
 
-                arc_json = json.dumps(arc_content)
+                # pydantic-core writes the JSON directly, skipping the intermediate dict
+                arc_json = rocrate.model_dump_json(by_alias=True)
                 arc_obj = ARC.from_rocrate_json_string(arc_json)
 
                 logger.info("Triggering Git storage for ARC %s", arc_id)
@@ -79,6 +79,16 @@ class Config(ConfigBase):
         ),
     ] = 5
 
+    api_docs_enabled: Annotated[
+        bool,
+        Field(
+            description=(
+                "Serve the interactive API docs (/docs, /redoc) and the OpenAPI schema (/openapi.json). "
+                "Disable in production to drop these routes from the routing table."
+            ),
+        ),
+    ] = True
+
     require_client_cert: Annotated[
         bool, Field(description="Require client certificate for API access (set to false for development)")
     ] = True
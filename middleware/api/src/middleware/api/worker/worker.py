@@ -8,6 +8,7 @@ import asyncio
 import logging
 import threading
 
+import uvloop
 from celery.signals import worker_shutdown
 
 from middleware.api.business_logic import BusinessLogic, BusinessLogicFactory, TransientError
@@ -25,7 +26,9 @@ class BusinessLogicManager:
     Celery prefork workers execute each task in a regular (non-async) thread.
     Rather than connecting to CouchDB on every task invocation, this class
     owns a persistent event loop and a persistent CouchDB connection that are
-    created once and reused across all tasks in the process lifetime.
+    created once and reused across all tasks in the process lifetime. The loop
+    is a uvloop loop, which has lower per-callback overhead than the default
+    selector loop for the CouchDB and git I/O the tasks wait on.
 
     Thread-safety is ensured by double-checked locking during initialization.
     """
@@ -45,7 +48,7 @@ class BusinessLogicManager:
             with cls._lock:
                 # Double-checked locking: only the first thread initializes.
                 if cls._business_logic is None:
-                    new_loop = asyncio.new_event_loop()
+                    new_loop = uvloop.new_event_loop()
                     asyncio.set_event_loop(new_loop)
                     bl = BusinessLogicFactory.create(loaded_config, mode="worker")
                     new_loop.run_until_complete(bl.startup())
@@ -1,5 +1,6 @@
 """Unit tests for the unified BusinessLogic class."""
 
+import json
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -207,6 +208,8 @@ async def test_worker_mode_sync_to_gitlab_success(worker_logic: BusinessLogic, m
     args, kwargs = mock_store.create_or_update.call_args
     assert args[0] == "arc_id"
     assert kwargs["rdi"] == rdi
+    (arc_json,) = mock_arc_class.from_rocrate_json_string.call_args.args
+    assert json.loads(arc_json) == arc_data
 
 
 @pytest.mark.asyncio
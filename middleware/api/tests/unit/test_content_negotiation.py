@@ -0,0 +1,168 @@
+"""Unit tests for the Accept / Content-Type validation middleware."""
+
+from __future__ import annotations
+
+from http import HTTPStatus
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from httpx import ASGITransport
+from starlette.types import Message, Receive, Scope, Send
+
+from middleware.api.api.content_negotiation import (
+    ContentNegotiationMiddleware,
+    has_json_body,
+    is_acceptable,
+    scan_headers,
+)
+
+
+def _app_with_negotiation() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/items")
+    async def list_items() -> list[str]:
+        return ["a"]
+
+    @app.post("/items")
+    async def create_item() -> dict[str, str]:
+        return {"status": "created"}
+
+    app.add_middleware(ContentNegotiationMiddleware, exempt_paths=["/docs", "/openapi.json"])
+    return app
+
+
+@pytest.mark.parametrize(
+    ("accept", "expected"),
+    [
+        (None, True),
+        (b"", True),
+        (b"*/*", True),
+        (b"application/json", True),
+        (b"text/html, application/json;q=0.9", True),
+        (b"application/xml", False),
+        (b"text/html", False),
+    ],
+)
+def test_is_acceptable(accept: bytes | None, expected: bool) -> None:
+    """Accept passes when absent, wildcard, or including application/json."""
+    assert is_acceptable(accept) is expected
+
+
+@pytest.mark.parametrize(
+    ("raw_headers", "expected"),
+    [
+        ([], True),
+        ([(b"content-length", b"0")], True),
+        ([(b"content-length", b"2"), (b"content-type", b"application/json")], True),
+        ([(b"content-length", b"2"), (b"content-type", b"application/json; charset=utf-8")], True),
+        ([(b"content-length", b"2")], False),
+        ([(b"content-length", b"2"), (b"content-type", b"text/plain")], False),
+        ([(b"transfer-encoding", b"chunked"), (b"content-type", b"text/plain")], False),
+    ],
+)
+def test_has_json_body(raw_headers: list[tuple[bytes, bytes]], expected: bool) -> None:
+    """Only requests that carry a body must declare application/json."""
+    _, content_type, has_body = scan_headers(raw_headers)
+    assert has_json_body(content_type, has_body=has_body) is expected
+
+
+def test_scan_headers_reads_accept() -> None:
+    """Accept is picked from the raw header list alongside unrelated headers."""
+    accept, content_type, has_body = scan_headers([(b"host", b"test"), (b"accept", b"application/json")])
+
+    assert accept == b"application/json"
+    assert content_type is None
+    assert has_body is False
+
+
+@pytest.mark.asyncio
+async def test_rejects_unacceptable_accept_header() -> None:
+    """A non-JSON Accept header yields 406 before the route runs."""
+    transport = ASGITransport(app=_app_with_negotiation())
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.get("/items", headers={"accept": "application/xml"})
+
+    assert response.status_code == HTTPStatus.NOT_ACCEPTABLE
+    assert response.json() == {"detail": "Accept must be application/json"}
+
+
+@pytest.mark.asyncio
+async def test_rejects_non_json_body() -> None:
+    """A POST body that is not declared as JSON yields 415."""
+    transport = ASGITransport(app=_app_with_negotiation())
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.post("/items", content=b"a=b", headers={"content-type": "text/plain"})
+
+    assert response.status_code == HTTPStatus.UNSUPPORTED_MEDIA_TYPE
+    assert response.json() == {"detail": "Content-Type must be application/json"}
+
+
+@pytest.mark.asyncio
+async def test_passes_valid_requests() -> None:
+    """JSON requests and body-less POSTs reach the route."""
+    transport = ASGITransport(app=_app_with_negotiation())
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        get_response = await client.get("/items", headers={"accept": "application/json"})
+        post_response = await client.post("/items", json={"name": "a"})
+        empty_post_response = await client.post("/items")
+
+    assert get_response.status_code == HTTPStatus.OK
+    assert post_response.status_code == HTTPStatus.OK
+    assert empty_post_response.status_code == HTTPStatus.OK
+
+
+@pytest.mark.asyncio
+async def test_exempt_paths_skip_checks() -> None:
+    """Docs and schema paths serve HTML and are not checked."""
+    transport = ASGITransport(app=_app_with_negotiation())
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.get("/docs", headers={"accept": "text/html"})
+
+    assert response.status_code == HTTPStatus.OK
+
+
+def test_api_installs_content_negotiation(client: TestClient) -> None:
+    """The Api app rejects non-JSON bodies but still serves the HTML docs."""
+    rejected = client.post("/v3/arcs", content=b"rdi=x", headers={"content-type": "text/plain"})
+    docs = client.get("/docs", headers={"accept": "text/html"})
+
+    assert rejected.status_code == HTTPStatus.UNSUPPORTED_MEDIA_TYPE
+    assert docs.status_code == HTTPStatus.OK
+
+
+@pytest.mark.asyncio
+async def test_repeated_rejections_are_identical() -> None:
+    """Repeated rejections carry the same body and a matching Content-Length."""
+    transport = ASGITransport(app=_app_with_negotiation())
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        first = await client.get("/items", headers={"accept": "text/html"})
+        second = await client.get("/items", headers={"accept": "text/html"})
+
+    assert first.status_code == second.status_code == HTTPStatus.NOT_ACCEPTABLE
+    assert first.content == second.content
+    assert first.headers["content-length"] == str(len(second.content))
+
+
+@pytest.mark.asyncio
+async def test_rejection_headers_are_not_shared_between_requests() -> None:
+    """Outer middleware appending to the header list in place must not leak into later rejections."""
+    inner = _app_with_negotiation()
+
+    async def tracing_app(scope: Scope, receive: Receive, send: Send) -> None:
+        async def traced_send(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"].append((b"traceparent", b"00-trace-span-01"))
+            await send(message)
+
+        await inner(scope, receive, traced_send)
+
+    transport = ASGITransport(app=tracing_app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        first = await client.get("/items", headers={"accept": "text/html"})
+        second = await client.get("/items", headers={"accept": "text/html"})
+
+    assert first.headers.get_list("traceparent") == ["00-trace-span-01"]
+    assert second.headers.multi_items() == first.headers.multi_items()
@@ -1,6 +1,8 @@
 """Unit tests for the FastAPI middleware API endpoints."""
 
+import datetime
 import http
+import inspect
 import logging
 import unittest.mock
 import uuid
@@ -9,11 +11,25 @@ from unittest.mock import AsyncMock, patch
 
 import pytest
 from cryptography import x509
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.x509.oid import ExtensionOID, NameOID
 from fastapi.testclient import TestClient
 
-from middleware.api.api.common.dependencies import get_client_id
+from middleware.api.api.common.dependencies import (
+    _allowed_rdis,
+    _common_name,
+    _load_client_cert,
+    get_business_logic,
+    get_client_id,
+    get_common_deps,
+    get_health_service,
+    get_task_status_store,
+)
 from middleware.api.api.fastapi_app import Api
 from middleware.api.api.legacy.task_types import SyncTaskResult, SyncTaskStatus
+from middleware.api.business_logic import BusinessLogic
+from middleware.api.config import Config
 from middleware.shared.api_models import (
     ArcOperationResult,
     ArcResponse,
@@ -33,6 +49,25 @@ def test_uvicorn_access_logger_uses_api_format() -> None:
     assert formatter._fmt == "%(asctime)s %(levelname)s %(name)s: %(message)s"
 
 
+@pytest.mark.parametrize(
+    "getter",
+    [get_business_logic, get_common_deps, get_health_service, get_task_status_store],
+)
+def test_app_state_getters_are_async(getter: Callable[..., object]) -> None:
+    """App-state dependencies must be coroutines so FastAPI skips the threadpool."""
+    assert inspect.iscoroutinefunction(getter)
+
+
+def test_api_docs_can_be_disabled(config: Config, service: BusinessLogic) -> None:
+    """With api_docs_enabled=False the docs and schema routes are not registered."""
+    api = Api(config.model_copy(update={"api_docs_enabled": False}))
+    api.business_logic = service
+    paths = {getattr(route, "path", None) for route in api.app.routes}
+
+    assert api.app.openapi_url is None
+    assert paths.isdisjoint({"/docs", "/redoc", "/openapi.json"})
+
+
 def test_whoami_success(client: TestClient, middleware_api: Api, cert: str) -> None:
     """Test the /v1/whoami endpoint with a valid certificate and accept header."""
     r = client.get(
@@ -85,6 +120,81 @@ def test_whoami_cert_verify_not_success(client: TestClient, cert: str, verify_st
     assert r.status_code == http.HTTPStatus.UNAUTHORIZED
 
 
+def test_client_cert_parsed_once_per_header(client: TestClient, cert: str) -> None:
+    """Repeated requests with the same certificate header reuse the parsed certificate."""
+    _load_client_cert.cache_clear()
+    headers = {"ssl-client-cert": cert, "ssl-client-verify": "SUCCESS", "accept": "application/json"}
+
+    first = client.get("/v1/whoami", headers=headers)
+    second = client.get("/v1/whoami", headers=headers)
+
+    assert first.status_code == http.HTTPStatus.OK
+    assert second.status_code == http.HTTPStatus.OK
+    cache_info = _load_client_cert.cache_info()
+    assert cache_info.misses == 1
+    assert cache_info.hits >= 1
+
+
+def test_client_identity_derived_once_per_cert(client: TestClient, cert: str) -> None:
+    """CN and granted RDIs are extracted once per certificate, not per request."""
+    _load_client_cert.cache_clear()
+    _common_name.cache_clear()
+    _allowed_rdis.cache_clear()
+    headers = {"ssl-client-cert": cert, "ssl-client-verify": "SUCCESS", "accept": "application/json"}
+
+    first = client.get("/v1/whoami", headers=headers)
+    second = client.get("/v1/whoami", headers=headers)
+
+    assert first.json() == second.json()
+    assert _common_name.cache_info().misses == 1
+    assert _allowed_rdis.cache_info().misses == 1
+    assert _allowed_rdis.cache_info().hits >= 1
+
+
+def test_allowed_rdis_reads_extension_by_oid(
+    oid: x509.ObjectIdentifier,
+    create_test_cert: Callable[[x509.ObjectIdentifier, list[str]], str],
+) -> None:
+    """RDIs come from the configured extension; a certificate without it grants none."""
+    cert = _load_client_cert(create_test_cert(oid, ["rdi-1", "rdi-2"]))
+
+    assert _allowed_rdis(cert, oid) == ("rdi-1", "rdi-2")
+    assert _allowed_rdis(cert, x509.ObjectIdentifier("1.2.3.4.5")) == ()
+
+
+def test_allowed_rdis_tolerates_malformed_extension(oid: x509.ObjectIdentifier) -> None:
+    """A certificate with an unparsable extension grants no RDIs instead of failing the request."""
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "Broken")])
+    now = datetime.datetime.now(datetime.UTC)
+    cert = (
+        x509
+        .CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now)
+        .not_valid_after(now + datetime.timedelta(days=1))
+        .add_extension(x509.UnrecognizedExtension(ExtensionOID.BASIC_CONSTRAINTS, b"garbage"), critical=False)
+        .sign(key, hashes.SHA256())
+    )
+
+    assert _allowed_rdis(cert, oid) == ()
+
+
+def test_liveness_v1(client: TestClient) -> None:
+    """Test /v1/liveness returns the static liveness payload and keeps its schema."""
+    r = client.get("/v1/liveness", headers={"accept": "application/json"})
+
+    assert r.status_code == http.HTTPStatus.OK
+    assert r.headers["content-type"] == "application/json"
+    assert r.json() == {"message": "ok"}
+    schema = client.get("/openapi.json").json()
+    response_schema = schema["paths"]["/v1/liveness"]["get"]["responses"]["200"]["content"]["application/json"]
+    assert response_schema["schema"]["$ref"].endswith("LivenessResponse")
+
+
 def test_health_check_success(client: TestClient, middleware_api: Api, cert: str) -> None:
     """Test /v1/health success."""
     with unittest.mock.patch.object(
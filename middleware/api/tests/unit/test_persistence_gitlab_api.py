@@ -3,27 +3,145 @@
 # pylint: disable=protected-access
 
 import base64
+import hashlib
 import http
+import json
+import threading
+import time
 from pathlib import Path
 from typing import Any
 from unittest.mock import MagicMock
 
 import pytest
-from gitlab.exceptions import GitlabGetError
+from gitlab.exceptions import GitlabGetError, GitlabListError
+from pydantic import HttpUrl, SecretStr
+from requests.adapters import DEFAULT_POOLSIZE
+
+from middleware.api.arc_store.gitlab_api import GitlabApi, GitlabApiConfig
 
 # -------------------- Hilfsfunktionen --------------------
 
 
+def _arc_hash(gitlab_api: Any, arc_dir: Path) -> str:
+    return str(gitlab_api._compute_arc_hash(gitlab_api._compute_file_digests(arc_dir)))  # noqa: SLF001
+
+
 def test_compute_arc_hash(tmp_path: Path, gitlab_api: Any) -> None:
     """Tests the hash computation for ARC directories."""
     file = tmp_path / "f.txt"
     file.write_text("hello")
-    h1 = gitlab_api._compute_arc_hash(tmp_path)  # noqa: SLF001
+    h1 = _arc_hash(gitlab_api, tmp_path)
     file.write_text("world")
-    h2 = gitlab_api._compute_arc_hash(tmp_path)  # noqa: SLF001
+    h2 = _arc_hash(gitlab_api, tmp_path)
     assert h1 != h2  # nosec
 
 
+def test_compute_arc_hash_detects_rename(tmp_path: Path, gitlab_api: Any) -> None:
+    """Tests that moving a file changes the ARC hash even if contents are unchanged."""
+    file = tmp_path / "a.txt"
+    file.write_text("hello")
+    h1 = _arc_hash(gitlab_api, tmp_path)
+    file.rename(tmp_path / "b.txt")
+    h2 = _arc_hash(gitlab_api, tmp_path)
+    assert h1 != h2  # nosec
+
+
+def test_compute_arc_hash_folds_leaves_in_path_order(tmp_path: Path, gitlab_api: Any) -> None:
+    """Tests that parallel leaf hashing folds digests in sorted path order."""
+    files = {"b.txt": b"beta", "a/x.bin": b"\x00\x01", "c.txt": b"gamma"}
+    for name, content in files.items():
+        (tmp_path / name).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / name).write_bytes(content)
+
+    expected = hashlib.sha256()
+    for name in sorted(files):
+        expected.update(name.encode() + b"\0" + hashlib.sha256(files[name]).digest())
+
+    assert _arc_hash(gitlab_api, tmp_path) == expected.hexdigest()  # nosec
+
+
+def test_compute_file_digests_walks_nested_directories(tmp_path: Path, gitlab_api: Any) -> None:
+    """Tests that files in subdirectories are keyed by their relative POSIX path."""
+    (tmp_path / "studies" / "s1").mkdir(parents=True)
+    (tmp_path / "empty").mkdir()
+    (tmp_path / "a.txt").write_text("a")
+    (tmp_path / "studies" / "s1" / "b.txt").write_text("b")
+
+    digests = gitlab_api._compute_file_digests(tmp_path)  # noqa: SLF001
+
+    assert digests == {  # nosec
+        "a.txt": hashlib.sha256(b"a").hexdigest(),
+        "studies/s1/b.txt": hashlib.sha256(b"b").hexdigest(),
+    }
+
+
+def test_compute_file_digests_uses_shared_hash_pool(tmp_path: Path, gitlab_api: Any, monkeypatch: Any) -> None:
+    """Tests that files are hashed on the store-wide hashing pool instead of a per-call pool."""
+    (tmp_path / "a.txt").write_text("a")
+    thread_names: list[str] = []
+
+    def record(path: str) -> bytes:
+        thread_names.append(threading.current_thread().name)
+        return hashlib.sha256(Path(path).read_bytes()).digest()
+
+    monkeypatch.setattr("middleware.api.arc_store.gitlab_api._file_digest", record)
+
+    gitlab_api._compute_file_digests(tmp_path)  # noqa: SLF001
+    gitlab_api._compute_file_digests(tmp_path)  # noqa: SLF001
+
+    assert all(name.startswith("gitlab-api-hash") for name in thread_names)  # nosec
+    assert len(thread_names) == 2  # nosec  # noqa: PLR2004
+
+
+@pytest.mark.asyncio
+async def test_shutdown_stops_both_executors(gitlab_api: Any) -> None:
+    """Tests that shutdown releases the API worker pool and the hashing pool."""
+    await gitlab_api.shutdown()
+
+    with pytest.raises(RuntimeError):
+        gitlab_api._executor.submit(print)  # noqa: SLF001
+    with pytest.raises(RuntimeError):
+        gitlab_api._hash_executor.submit(print)  # noqa: SLF001
+
+
+def test_build_file_action_text_and_binary(tmp_path: Path, gitlab_api: Any) -> None:
+    """Tests that UTF-8 files are sent as text and everything else as base64."""
+    (tmp_path / "a.txt").write_text("häll\u00f6", encoding="utf-8")
+    (tmp_path / "b.bin").write_bytes(b"\xff\x00\xfe")
+
+    text = gitlab_api._build_file_action(tmp_path / "a.txt", "a.txt", "create")  # noqa: SLF001
+    binary = gitlab_api._build_file_action(tmp_path / "b.bin", "b.bin", "update")  # noqa: SLF001
+
+    assert text == {"action": "create", "file_path": "a.txt", "content": "häll\u00f6"}  # nosec
+    assert binary == {  # nosec
+        "action": "update",
+        "file_path": "b.bin",
+        "content": base64.b64encode(b"\xff\x00\xfe").decode(),
+        "encoding": "base64",
+    }
+
+
+def test_connection_pool_matches_max_workers() -> None:
+    """Tests that every worker thread can keep its own GitLab connection."""
+    max_workers = 12
+    config = GitlabApiConfig(
+        url=HttpUrl("https://gitlab"), token=SecretStr("token"), group="1", max_workers=max_workers
+    )  # nosec
+    api = GitlabApi(config)
+
+    adapter = api._gitlab.session.get_adapter("https://gitlab/")  # noqa: SLF001
+    assert adapter._pool_maxsize == max_workers  # nosec  # noqa: SLF001
+
+
+def test_connection_pool_never_below_requests_default() -> None:
+    """Tests that the default max_workers does not shrink requests' default connection pool."""
+    config = GitlabApiConfig(url=HttpUrl("https://gitlab"), token=SecretStr("token"), group="1")  # nosec
+    api = GitlabApi(config)
+
+    adapter = api._gitlab.session.get_adapter("https://gitlab/")  # noqa: SLF001
+    assert adapter._pool_maxsize >= DEFAULT_POOLSIZE  # nosec  # noqa: SLF001
+
+
 def test_get_or_create_project_found(gitlab_api: Any) -> None:
     """Tests finding an existing GitLab project."""
     project = MagicMock()
@@ -45,6 +163,62 @@ def test_get_or_create_project_create(gitlab_api: Any) -> None:
     assert result == project  # nosec
 
 
+def test_find_project_reuses_cached_project_id(gitlab_api: Any) -> None:
+    """A second lookup for the same ARC fetches the project by id without searching."""
+    project = MagicMock()
+    project.path = "arc1"
+    project.id = 42
+    gitlab_api._gitlab.projects.list.return_value = [project]  # noqa: SLF001
+    gitlab_api._gitlab.projects.get.return_value = project  # noqa: SLF001
+
+    gitlab_api._find_project("arc1")  # noqa: SLF001
+    result = gitlab_api._find_project("arc1")  # noqa: SLF001
+
+    assert result is project  # nosec
+    gitlab_api._gitlab.projects.list.assert_called_once()  # noqa: SLF001
+    gitlab_api._gitlab.projects.get.assert_called_once_with(42)  # noqa: SLF001
+
+
+def test_find_project_evicts_stale_cached_id(gitlab_api: Any) -> None:
+    """A cached id whose project was deleted elsewhere falls back to the search."""
+    gitlab_api._project_ids["arc1"] = 42  # noqa: SLF001
+    gitlab_api._gitlab.projects.get.side_effect = GitlabGetError(  # noqa: SLF001
+        "not found", response_code=http.HTTPStatus.NOT_FOUND
+    )
+    gitlab_api._gitlab.projects.list.return_value = []  # noqa: SLF001
+
+    assert gitlab_api._find_project("arc1") is None  # nosec  # noqa: SLF001
+    assert "arc1" not in gitlab_api._project_ids  # nosec  # noqa: SLF001
+    gitlab_api._gitlab.projects.list.assert_called_once_with(search="arc1")  # noqa: SLF001
+
+
+def test_find_project_evicts_renamed_project(gitlab_api: Any) -> None:
+    """A cached id that now belongs to a different path is not reused."""
+    gitlab_api._project_ids["arc1"] = 42  # noqa: SLF001
+    renamed = MagicMock()
+    renamed.path = "other"
+    found = MagicMock()
+    found.path = "arc1"
+    found.id = 43
+    gitlab_api._gitlab.projects.get.return_value = renamed  # noqa: SLF001
+    gitlab_api._gitlab.projects.list.return_value = [found]  # noqa: SLF001
+
+    assert gitlab_api._find_project("arc1") is found  # nosec  # noqa: SLF001
+    assert gitlab_api._project_ids["arc1"] == found.id  # nosec  # noqa: SLF001
+
+
+def test_project_id_cache_is_bounded(gitlab_api: Any, monkeypatch: Any) -> None:
+    """The least recently used ARC is evicted once the cache is full."""
+    monkeypatch.setattr("middleware.api.arc_store.gitlab_api._PROJECT_ID_CACHE_SIZE", 2)
+
+    gitlab_api._remember_project_id("a", 1)  # noqa: SLF001
+    gitlab_api._remember_project_id("b", 2)  # noqa: SLF001
+    gitlab_api._remember_project_id("a", 1)  # noqa: SLF001
+    gitlab_api._remember_project_id("c", 3)  # noqa: SLF001
+
+    assert list(gitlab_api._project_ids) == ["a", "c"]  # nosec  # noqa: SLF001
+
+
 # -------------------- Create/Update --------------------
 
 
@@ -56,6 +230,7 @@ async def test_create_or_update_no_changes(gitlab_api: Any) -> None:
 
     project = MagicMock()
     # .arc_hash mit "dummyhash" vorhanden
+    project.repository_tree.return_value = [{"type": "blob", "path": ".arc_hash"}]
     project.files.get.return_value.content = base64.b64encode(b"dummyhash").decode()
     gitlab_api._get_or_create_project = lambda _arc_id: project  # noqa: SLF001
     gitlab_api._compute_arc_hash = lambda _path: "dummyhash"  # noqa: SLF001
@@ -87,6 +262,121 @@ async def test_create_or_update_with_changes(gitlab_api: Any) -> None:
     assert any(a["file_path"] == ".arc_hash" for a in actions)  # nosec
 
 
+@pytest.mark.asyncio
+async def test_create_or_update_new_project_skips_hash_lookup(gitlab_api: Any) -> None:
+    """Tests that .arc_hash is not fetched when the tree listing does not contain it."""
+    arc = MagicMock()
+    arc.Write = lambda path: (Path(path) / "f.txt").write_text("abc")
+
+    project = MagicMock()
+    project.repository_tree.return_value = [{"type": "blob", "path": "f.txt"}]
+    gitlab_api._get_or_create_project = lambda _arc_id: project  # noqa: SLF001
+
+    await gitlab_api.create_or_update("arc1", arc, rdi="test-rdi")
+
+    project.repository_tree.assert_called_once()
+    project.files.get.assert_not_called()
+    args, _kwargs = project.commits.create.call_args
+    actions = {a["file_path"]: a["action"] for a in args[0]["actions"]}
+    assert actions == {"f.txt": "update", ".arc_hash": "create", ".arc_hashes.json": "create"}  # nosec
+
+
+@pytest.mark.asyncio
+async def test_create_or_update_commits_only_changed_files(gitlab_api: Any) -> None:
+    """Tests that unchanged files are skipped and files dropped from the ARC are deleted."""
+
+    def write(path: str) -> None:
+        (Path(path) / "same.txt").write_text("same")
+        (Path(path) / "changed.txt").write_text("new")
+        (Path(path) / "added.txt").write_text("added")
+
+    arc = MagicMock()
+    arc.Write = write
+
+    old_digests = {
+        "same.txt": hashlib.sha256(b"same").hexdigest(),
+        "changed.txt": hashlib.sha256(b"old").hexdigest(),
+        "removed.txt": hashlib.sha256(b"gone").hexdigest(),
+    }
+    remote = {".arc_hash": b"oldhash", ".arc_hashes.json": json.dumps(old_digests).encode()}
+
+    project = MagicMock()
+    project.repository_tree.return_value = [
+        {"type": "blob", "path": path} for path in [*remote, "same.txt", "changed.txt", "removed.txt"]
+    ]
+
+    def get_file(file_path: str, **_kwargs: Any) -> MagicMock:
+        fobj = MagicMock()
+        fobj.content = base64.b64encode(remote[file_path]).decode()
+        return fobj
+
+    project.files.get.side_effect = get_file
+    gitlab_api._get_or_create_project = lambda _arc_id: project  # noqa: SLF001
+
+    await gitlab_api.create_or_update("arc1", arc, rdi="test-rdi")
+
+    args, _kwargs = project.commits.create.call_args
+    actions = {a["file_path"]: a["action"] for a in args[0]["actions"]}
+    assert actions == {  # nosec
+        "changed.txt": "update",
+        "added.txt": "create",
+        "removed.txt": "delete",
+        ".arc_hash": "update",
+        ".arc_hashes.json": "update",
+    }
+
+
+@pytest.mark.asyncio
+async def test_create_or_update_loads_remote_state_while_writing(gitlab_api: Any) -> None:
+    """Tests that the repository tree is listed while the ARC is still being written."""
+    tree_listed = threading.Event()
+
+    def write(path: str) -> None:
+        assert tree_listed.wait(timeout=5)  # nosec
+        (Path(path) / "f.txt").write_text("abc")
+
+    def list_tree(**_kwargs: Any) -> list[dict[str, str]]:
+        tree_listed.set()
+        return []
+
+    arc = MagicMock()
+    arc.Write = write
+    project = MagicMock()
+    project.repository_tree.side_effect = list_tree
+    gitlab_api._get_or_create_project = lambda _arc_id: project  # noqa: SLF001
+
+    await gitlab_api.create_or_update("arc1", arc, rdi="test-rdi")
+
+    project.commits.create.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_create_or_update_waits_for_writer_when_remote_fails(gitlab_api: Any) -> None:
+    """Tests that a remote failure is raised only after the local write has finished."""
+    tree_failed = threading.Event()
+    write_finished = threading.Event()
+
+    def write(path: str) -> None:
+        tree_failed.wait(timeout=5)
+        time.sleep(0.05)
+        (Path(path) / "f.txt").write_text("abc")
+        write_finished.set()
+
+    def list_tree(**_kwargs: Any) -> list[dict[str, str]]:
+        tree_failed.set()
+        raise GitlabListError("boom", response_code=http.HTTPStatus.INTERNAL_SERVER_ERROR)
+
+    arc = MagicMock()
+    arc.Write = write
+    project = MagicMock()
+    project.repository_tree.side_effect = list_tree
+    gitlab_api._get_or_create_project = lambda _arc_id: project  # noqa: SLF001
+
+    with pytest.raises(GitlabListError):
+        await gitlab_api._create_or_update("arc1", arc, rdi="test-rdi")  # noqa: SLF001
+    assert write_finished.is_set()  # nosec
+
+
 # -------------------- Get --------------------
 
 
@@ -115,6 +405,95 @@ async def test_get_success(gitlab_api: Any, monkeypatch: Any) -> None:
     project.files.get.assert_any_call(file_path="f.txt", ref=gitlab_api._config.branch)
 
 
+@pytest.mark.asyncio
+async def test_get_waits_for_all_downloads_before_raising(gitlab_api: Any) -> None:
+    """Tests that a failed download is raised only after the other downloads have finished."""
+    project = MagicMock()
+    project.path = "arc1"
+    project.repository_tree.return_value = [
+        {"type": "blob", "path": "bad.txt"},
+        {"type": "blob", "path": "slow.txt"},
+    ]
+    slow_started = threading.Event()
+    slow_finished = threading.Event()
+
+    def get_file(file_path: str, **_kwargs: Any) -> MagicMock:
+        if file_path == "bad.txt":
+            slow_started.wait(timeout=5)
+            raise GitlabGetError("boom", response_code=http.HTTPStatus.INTERNAL_SERVER_ERROR)
+        slow_started.set()
+        time.sleep(0.05)
+        slow_finished.set()
+        fobj = MagicMock()
+        fobj.content = base64.b64encode(b"slow").decode()
+        fobj.encoding = None
+        return fobj
+
+    project.files.get.side_effect = get_file
+    gitlab_api._gitlab.projects.list.return_value = [project]
+
+    with pytest.raises(GitlabGetError):
+        await gitlab_api._get("arc1")
+    assert slow_finished.is_set()  # nosec
+
+
+@pytest.mark.asyncio
+async def test_get_downloads_all_blobs(gitlab_api: Any, monkeypatch: Any) -> None:
+    """Tests that every blob except .arc_hash is written below the ARC directory."""
+    project = MagicMock()
+    project.path = "arc1"
+    project.repository_tree.return_value = [
+        {"type": "blob", "path": "isa.investigation.xlsx"},
+        {"type": "tree", "path": "studies"},
+        {"type": "blob", "path": "studies/s1/README.md"},
+        {"type": "blob", "path": ".arc_hash"},
+    ]
+
+    def get_file(file_path: str, **_kwargs: Any) -> MagicMock:
+        fobj = MagicMock()
+        fobj.content = base64.b64encode(file_path.encode()).decode()
+        fobj.encoding = None
+        return fobj
+
+    project.files.get.side_effect = get_file
+    gitlab_api._gitlab.projects.list.return_value = [project]
+
+    written: dict[str, str] = {}
+
+    def load(path: str) -> MagicMock:
+        root = Path(path)
+        written.update({str(p.relative_to(root)): p.read_text() for p in root.rglob("*") if p.is_file()})
+        return MagicMock()
+
+    monkeypatch.setattr("middleware.api.arc_store.gitlab_api.ARC.load", load)
+
+    await gitlab_api.get("arc1")
+
+    assert written == {  # nosec
+        "isa.investigation.xlsx": "isa.investigation.xlsx",
+        "studies/s1/README.md": "studies/s1/README.md",
+    }
+
+
+@pytest.mark.asyncio
+async def test_get_stages_files_in_configured_temp_dir(gitlab_api: Any, monkeypatch: Any, tmp_path: Path) -> None:
+    """Tests that the ARC is staged below the configured temp_dir."""
+    gitlab_api._config = gitlab_api._config.model_copy(update={"temp_dir": tmp_path})
+    project = MagicMock()
+    project.path = "arc1"
+    project.repository_tree.return_value = []
+    gitlab_api._gitlab.projects.list.return_value = [project]
+
+    load_paths: list[Path] = []
+    monkeypatch.setattr(
+        "middleware.api.arc_store.gitlab_api.ARC.load", lambda path: load_paths.append(Path(path)) or MagicMock()
+    )
+
+    await gitlab_api.get("arc1")
+
+    assert load_paths[0].is_relative_to(tmp_path)  # nosec
+
+
 @pytest.mark.asyncio
 async def test_get_not_found(gitlab_api: Any) -> None:
     """Tests retrieving a non-existing ARC from GitLab."""
@@ -134,6 +513,7 @@ async def test_delete_found(gitlab_api: Any) -> None:
     gitlab_api._gitlab.projects.list.return_value = [project]
     await gitlab_api.delete("arc1")
     project.delete.assert_called_once()
+    assert "arc1" not in gitlab_api._project_ids
 
 
 @pytest.mark.asyncio
@@ -4,8 +4,9 @@ import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+import uvloop
 
-from middleware.api.worker.worker import sync_arc_to_gitlab
+from middleware.api.worker.worker import BusinessLogicManager, sync_arc_to_gitlab
 
 
 def test_sync_arc_to_gitlab_success() -> None:
@@ -56,3 +57,24 @@ def test_sync_arc_to_gitlab_initialization_error() -> None:
         sync_arc_to_gitlab.apply(
             args=({"rdi": "test-rdi", "arc": {"dummy": "data"}, "client_id": "test-client"},)
         ).get()
+
+
+def test_business_logic_manager_uses_uvloop() -> None:
+    """The persistent worker event loop is a uvloop loop and is reused across calls."""
+    mock_bl = MagicMock()
+    mock_bl.startup = AsyncMock()
+    mock_bl.shutdown = AsyncMock()
+    with patch("middleware.api.worker.worker.BusinessLogicFactory.create", return_value=mock_bl):
+        bl, loop = BusinessLogicManager.get()
+        try:
+            assert bl is mock_bl
+            assert isinstance(loop, uvloop.Loop)
+            assert BusinessLogicManager.get()[1] is loop
+        finally:
+            BusinessLogicManager.shutdown()
+            loop.close()
+            # get() installed the loop as the thread's current loop; don't leak it into later tests.
+            asyncio.set_event_loop(None)
+
+    mock_bl.startup.assert_awaited_once()
+    mock_bl.shutdown.assert_awaited_once()
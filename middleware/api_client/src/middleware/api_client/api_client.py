@@ -287,42 +287,31 @@ class ApiClient:
             logger.warning("[%s] Failed to mark harvest %s as failed", rdi, harvest_id)
 
     @classmethod
-    async def _cancel_pending_arc_tasks(cls, pending_tasks: set[asyncio.Task[None]]) -> None:
-        """Cancel and await remaining ARC submission tasks."""
-        for pending_task in pending_tasks:
-            pending_task.cancel()
-        await asyncio.gather(*pending_tasks, return_exceptions=True)
-
-    def _process_completed_arc_tasks(
-        self,
-        harvest_id: str,
-        done_tasks: set[asyncio.Task[None]],
-        task_identifiers: dict[asyncio.Task[None], str | None],
-    ) -> tuple[list[HarvestError], Exception | None]:
-        """Return (errors, catastrophic_error) for completed submission tasks."""
-        errors: list[HarvestError] = []
-        catastrophic_error: Exception | None = None
-
-        for done_task in done_tasks:
-            arc_id = task_identifiers.pop(done_task, None)
-            try:
-                done_task.result()
-            except Exception as e:  # noqa: BLE001
-                if self._is_catastrophic_harvest_error(e):
-                    if catastrophic_error is None:
-                        catastrophic_error = e
-                else:
-                    errors.append(
-                        HarvestError(
-                            arc_id=arc_id,
-                            error_type=HarvestErrorType.SUBMISSION_FAILED,
-                            message=str(e),
-                            timestamp=datetime.now(UTC).isoformat(),
-                        )
-                    )
-                    logger.warning("Skipping failed ARC submission in harvest %s: %s", harvest_id, e)
+    def _submission_error(cls, harvest_id: str, arc_id: str | None, error: Exception) -> HarvestError:
+        """Build the per-item error for a non-catastrophic ARC submission failure."""
+        logger.warning("Skipping failed ARC submission in harvest %s: %s", harvest_id, error)
+        return HarvestError(
+            arc_id=arc_id,
+            error_type=HarvestErrorType.SUBMISSION_FAILED,
+            message=str(error),
+            timestamp=datetime.now(UTC).isoformat(),
+        )
 
-        return errors, catastrophic_error
+    @classmethod
+    def _duplicate_error(cls, harvest_id: str, arc_id: str) -> HarvestError:
+        """Build the per-item error for an ARC identifier already seen in this harvest."""
+        logger.error(
+            "Duplicate ARC identifier '%s' in harvest %s — "
+            "several ARCs share the same identifier (client-side data error).",
+            arc_id,
+            harvest_id,
+        )
+        return HarvestError(
+            arc_id=arc_id,
+            error_type=HarvestErrorType.DUPLICATE,
+            message=f"Duplicate ARC identifier '{arc_id}' — two ARCs share the same identifier",
+            timestamp=datetime.now(UTC).isoformat(),
+        )
 
     async def _submit_arcs_parallel(
         self,
@@ -331,59 +320,46 @@ class ApiClient:
     ) -> list[HarvestError]:
         """Submit all ARCs in bounded parallelism and return per-item errors.
 
+        Submissions run inside an :class:`asyncio.TaskGroup`: a catastrophic
+        error cancels all sibling submissions and stops consuming *arcs*. The
+        first catastrophic error is re-raised unwrapped so callers keep seeing
+        :class:`ApiClientError` rather than an ``ExceptionGroup``.
+
         Compatibility shim (issue #240): duplicate detection and submission
         failures are recorded client-side until the server persists them natively.
         """
-        pending_tasks: set[asyncio.Task[None]] = set()
-        task_identifiers: dict[asyncio.Task[None], str | None] = {}
         errors: list[HarvestError] = []
         seen_identifiers: set[str] = set()
+        slots = asyncio.Semaphore(self._config.max_concurrency)
 
-        async def submit_one(arc_item: dict[str, Any]) -> None:
-            request = SubmitHarvestArcRequest(arc=self._validate_rocrate(arc_item))
-            await self._post(f"v3/harvests/{harvest_id}/arcs", request)
-
-        async for arc in arcs:
-            serialized = self._serialize_arc(arc)
-            identifier = self._extract_identifier_from_rocrate(serialized)
-            if identifier is not None:
-                if identifier in seen_identifiers:
-                    logger.error(
-                        "Duplicate ARC identifier '%s' in harvest %s — "
-                        "several ARCs share the same identifier (client-side data error).",
-                        identifier,
-                        harvest_id,
-                    )
-                    errors.append(
-                        HarvestError(
-                            arc_id=identifier,
-                            error_type=HarvestErrorType.DUPLICATE,
-                            message=f"Duplicate ARC identifier '{identifier}' — two ARCs share the same identifier",
-                            timestamp=datetime.now(UTC).isoformat(),
-                        )
-                    )
-                    continue
-                seen_identifiers.add(identifier)
-
-            task = asyncio.create_task(submit_one(serialized))
-            task_identifiers[task] = identifier
-            pending_tasks.add(task)
-
-            if len(pending_tasks) >= self._config.max_concurrency:
-                done, pending = await asyncio.wait(pending_tasks, return_when=asyncio.FIRST_COMPLETED)
-                pending_tasks = pending
-                new_errors, catastrophic_error = self._process_completed_arc_tasks(harvest_id, done, task_identifiers)
-                errors.extend(new_errors)
-                if catastrophic_error is not None:
-                    await self._cancel_pending_arc_tasks(pending_tasks)
-                    raise catastrophic_error
-
-        if pending_tasks:
-            done, _ = await asyncio.wait(pending_tasks)
-            new_errors, catastrophic_error = self._process_completed_arc_tasks(harvest_id, done, task_identifiers)
-            errors.extend(new_errors)
-            if catastrophic_error is not None:
-                raise catastrophic_error
+        async def submit_one(arc_item: dict[str, Any], arc_id: str | None) -> None:
+            try:
+                request = SubmitHarvestArcRequest(arc=self._validate_rocrate(arc_item))
+                await self._post(f"v3/harvests/{harvest_id}/arcs", request)
+            except Exception as e:
+                if self._is_catastrophic_harvest_error(e):
+                    raise
+                errors.append(self._submission_error(harvest_id, arc_id, e))
+            finally:
+                slots.release()
+
+        try:
+            async with asyncio.TaskGroup() as task_group:
+                async for arc in arcs:
+                    serialized = self._serialize_arc(arc)
+                    identifier = self._extract_identifier_from_rocrate(serialized)
+                    if identifier is not None:
+                        if identifier in seen_identifiers:
+                            errors.append(self._duplicate_error(harvest_id, identifier))
+                            continue
+                        seen_identifiers.add(identifier)
+
+                    # Acquire before spawning so a slow API applies backpressure
+                    # to the generator instead of queueing unbounded tasks.
+                    await slots.acquire()
+                    task_group.create_task(submit_one(serialized, identifier))
+        except ExceptionGroup as group:
+            raise group.exceptions[0] from None
 
         return errors
 
@@ -451,6 +427,7 @@ class ApiClient:
                 verify=verify,
                 timeout=self._config.timeout,
                 follow_redirects=self._config.follow_redirects,
+                http2=self._config.http2,
                 headers={"accept": "application/json"},
             )
             logger.debug("Created new httpx.AsyncClient instance")
@@ -573,11 +550,11 @@ class ApiClient:
         if isinstance(arc, str):
             try:
                 data = json.loads(arc)
-                if not isinstance(data, dict):
-                    raise ApiClientError(f"JSON string must represent a dictionary, got {type(data).__name__}")
-                return cast(dict[str, Any], data)
             except json.JSONDecodeError as e:
                 raise ApiClientError(f"Invalid JSON string provided for ARC: {e}") from e
+            if not isinstance(data, dict):
+                raise ApiClientError(f"JSON string must represent a dictionary, got {type(data).__name__}")
+            return cast(dict[str, Any], data)
         return cast(dict[str, Any], json.loads(arc.ToROCrateJsonString()))
 
     @classmethod
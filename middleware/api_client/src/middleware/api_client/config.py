@@ -28,6 +28,15 @@ class Config(ConfigBase):
     timeout: Annotated[float, Field(description="Request timeout in seconds", gt=0)] = 30.0
     verify_ssl: Annotated[bool, Field(description="Enable SSL certificate verification")] = True
     follow_redirects: Annotated[bool, Field(description="Follow HTTP redirects for API requests")] = True
+    http2: Annotated[
+        bool,
+        Field(
+            description=(
+                "Negotiate HTTP/2 so concurrent requests are multiplexed over a single connection "
+                "(falls back to HTTP/1.1 if the server does not offer h2 via ALPN)"
+            )
+        ),
+    ] = True
     max_concurrency: Annotated[
         int,
         Field(description="Maximum number of concurrent API requests across the ApiClient package", ge=1),
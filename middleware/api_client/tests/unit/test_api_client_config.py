@@ -59,6 +59,7 @@ def test_config_with_defaults() -> None:
     assert config.timeout == 30.0  # noqa: PLR2004
     assert config.verify_ssl is True
     assert config.follow_redirects is True
+    assert config.http2 is True
     assert config.max_concurrency == 10  # noqa: PLR2004
 
 
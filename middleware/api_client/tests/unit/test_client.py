@@ -100,6 +100,19 @@ async def test_client_verify_ssl_false(test_config_dict: dict) -> None:
         assert kwargs["verify"] is False
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize("http2", [True, False])
+async def test_client_http2_setting(test_config_dict: dict, http2: bool) -> None:
+    """Test that the http2 setting is passed through to httpx.AsyncClient."""
+    test_config_dict["http2"] = http2
+    config = Config.from_data(test_config_dict)
+    client = ApiClient(config)
+    with patch("httpx.AsyncClient") as mock_client:
+        client._get_client()  # noqa: SLF001
+        _, kwargs = mock_client.call_args
+        assert kwargs["http2"] is http2
+
+
 @pytest.mark.asyncio
 async def test_client_with_ca_cert(test_config_dict: dict, temp_dir: Path) -> None:
     """Test client initialization with a CA certificate."""
@@ -218,6 +231,19 @@ async def test_create_or_update_arc_with_invalid_json_string(client_config: Conf
             await client.create_or_update_arc(rdi="test-rdi", arc='{"@context":')
 
 
+@pytest.mark.asyncio
+async def test_create_or_update_arc_with_non_object_json_string(client_config: Config) -> None:
+    """Test create_or_update_arc with a JSON string that is not an object."""
+    async with ApiClient(client_config) as client:
+        with pytest.raises(ApiClientError, match="JSON string must represent a dictionary, got list"):
+            await client.create_or_update_arc(rdi="test-rdi", arc="[1, 2]")
+
+
+def test_serialize_arc_accepts_lone_surrogate_escape() -> None:
+    """JSON strings are parsed as leniently as json.loads, including lone surrogate escapes."""
+    assert ApiClient._serialize_arc('{"name": "\\ud800"}') == {"name": "\ud800"}
+
+
 @pytest.mark.asyncio
 @respx.mock
 async def test_create_or_update_arc_http_error(client_config: Config) -> None:
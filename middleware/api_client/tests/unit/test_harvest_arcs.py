@@ -292,21 +292,19 @@ async def test_harvest_arcs_all_exceptions_retrieved_when_multiple_tasks_catastr
     Regression test for the "Task exception was never retrieved" asyncio warning
     (confirmed in production: Task-1149, HTTP 500 for harvest arc submission).
 
-    Root cause: the old `_process_completed_arc_tasks` returned early after the
+    Root cause: the former hand-rolled asyncio.wait loop returned early after the
     first catastrophic error, leaving the remaining done tasks' exceptions
     unretrieved. asyncio then emitted a RuntimeWarning.
 
-    With max_concurrency=10 and 3 ARCs, all three tasks land in the same done
-    batch during the final drain (asyncio.wait). The early-return bug would leave
-    the 2nd and 3rd exceptions unretrieved. This test is run with
-    -W error::RuntimeWarning (see pyproject.toml) so any unretrieved exception
-    would immediately fail the test.
+    With max_concurrency=10 and 3 ARCs, all three submissions run concurrently
+    and fail together. The TaskGroup collects every child exception, so none is
+    left unretrieved. This test is run with -W error::RuntimeWarning (see
+    pyproject.toml) so any unretrieved exception would immediately fail the test.
 
     Note: 409 Conflict is used here because it is catastrophic (abort harvest).
     HTTP 500 is *not* catastrophic since this fix — see
     test_harvest_arcs_500_is_submission_failed for the non-catastrophic path.
-    The asyncio-warning fix (no early return in _process_completed_arc_tasks)
-    applies to both paths.
+    The asyncio-warning fix applies to both paths.
     """
     respx.post(f"{client_config.api_url}v3/harvests").mock(
         return_value=httpx.Response(http.HTTPStatus.OK, json=HARVEST_RESPONSE)
@@ -318,11 +316,9 @@ async def test_harvest_arcs_all_exceptions_retrieved_when_multiple_tasks_catastr
         return_value=httpx.Response(http.HTTPStatus.OK, json={**HARVEST_RESPONSE, "status": "FAILED"})
     )
 
-    # 3 ARCs all returning 409 (catastrophic). With max_concurrency=10, no
-    # intermediate wait fires — all three tasks accumulate in pending_tasks and
-    # are drained together. If _process_completed_arc_tasks returned early after
-    # the first catastrophic error, the remaining two exceptions would be
-    # unretrieved → RuntimeWarning (promoted to error by -W error).
+    # 3 ARCs all returning 409 (catastrophic). With max_concurrency=10 all
+    # three submissions are in flight at once. Any exception left unretrieved
+    # would surface as a RuntimeWarning (promoted to error by -W error).
     async with ApiClient(client_config) as client:
         with pytest.raises(ApiClientError, match="HTTP error 409"):
             await client.harvest_arcs(
@@ -333,6 +329,28 @@ async def test_harvest_arcs_all_exceptions_retrieved_when_multiple_tasks_catastr
     assert fail_route.called
 
 
+@pytest.mark.asyncio
+@respx.mock
+async def test_harvest_arcs_catastrophic_error_stops_consuming_arcs(client_config: Config) -> None:
+    """A catastrophic error cancels the fan-out instead of draining the whole generator."""
+    client_config.max_concurrency = 1
+    respx.post(f"{client_config.api_url}v3/harvests").mock(
+        return_value=httpx.Response(http.HTTPStatus.OK, json=HARVEST_RESPONSE)
+    )
+    submit_route = respx.post(f"{client_config.api_url}v3/harvests/harvest-456/arcs").mock(
+        return_value=httpx.Response(http.HTTPStatus.FORBIDDEN, text="forbidden")
+    )
+    respx.patch(f"{client_config.api_url}v3/harvests/harvest-456").mock(
+        return_value=httpx.Response(http.HTTPStatus.OK, json={**HARVEST_RESPONSE, "status": "FAILED"})
+    )
+
+    async with ApiClient(client_config) as client:
+        with pytest.raises(ApiClientError, match="HTTP error 403"):
+            await client.harvest_arcs("test-rdi", arc_gen(*(rocrate_dict(f"arc-{i}") for i in range(20))))
+
+    assert submit_route.call_count < 20  # noqa: PLR2004
+
+
 @pytest.mark.asyncio
 @respx.mock
 async def test_harvest_arcs_500_is_submission_failed(client_config: Config) -> None:
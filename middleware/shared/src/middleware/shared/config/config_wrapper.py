@@ -4,6 +4,7 @@ Overriding single entries in the yaml tree by env vars or docker
 secret files in /run/secrets.
 """
 
+import functools
 import os
 from abc import abstractmethod
 from collections.abc import Generator
@@ -19,6 +20,34 @@ type PrimitiveType = str | int | float | bool | None
 type ValueType = DictType | ListType | PrimitiveType
 type WrapType = "ConfigWrapper | PrimitiveType"
 
+_SECRETS_DIR = Path("/run/secrets")
+
+
+@functools.cache
+def _load_secrets() -> frozenset[str]:
+    """List the Docker secret files once and return their names.
+
+    Only the names are cached: they decide which keys exist and are fixed when
+    the secrets are mounted at container start. Values are read on demand by
+    ``_read_secret`` so unused secrets stay out of memory and rotated files are
+    picked up. Sub-directories (such as Kubernetes' ``..data``) are skipped.
+    Tests that change ``_SECRETS_DIR`` must call ``_load_secrets.cache_clear()``.
+    """
+    try:
+        return frozenset(entry.name for entry in _SECRETS_DIR.iterdir() if entry.is_file())
+    except OSError:
+        return frozenset()
+
+
+def _read_secret(name: str) -> str | None:
+    """Return the current value of the secret file *name*, or None if absent or unreadable."""
+    if name not in _load_secrets():
+        return None
+    try:
+        return (_SECRETS_DIR / name).read_text(encoding="utf-8").strip()
+    except (OSError, UnicodeDecodeError):
+        return None
+
 
 class ConfigWrapper:
     """Wraps nested dicts and lists (aka loaded yaml).
@@ -34,9 +63,11 @@ class ConfigWrapper:
 
         """
         self._path = path.upper()
+        # Precomputed once: every key access builds an env/secret name from it.
+        self._prefix = f"{self._path}_" if self._path else ""
 
     def _build_path(self, key: str) -> str:
-        return f"{self._path}_{key}" if self._path else key
+        return self._prefix + key
 
     def _wrap(self, value: "ValueType | None", key: str) -> WrapType:
         return ConfigWrapper._from_value(value, self._build_path(key))
@@ -191,9 +222,7 @@ class ConfigWrapper:
 
         # 2️⃣ Check Docker secret file
         if override_value is None:
-            secret_file = Path(f"/run/secrets/{full_key.lower()}")
-            if secret_file.exists():
-                override_value = secret_file.read_text(encoding="utf-8").strip()
+            override_value = _read_secret(full_key.lower())
 
         if override_value is None:
             return None
@@ -258,7 +287,7 @@ class ConfigWrapperDict(ConfigWrapper):
     def _all_keys(self) -> set[str]:
         """All keys including discovered ENV/Secrets."""
         keys = set(self._data.keys())
-        prefix = f"{self._path}_" if self._path else ""
+        prefix = self._prefix
 
         # Only discover new keys from environment if we are within a sub-path
         # Root level keys must be present in the YAML to be overridden
@@ -268,13 +297,11 @@ class ConfigWrapperDict(ConfigWrapper):
                     key_suffix = env_key[len(prefix) :]
                     keys.add(key_suffix.lower())
 
-        secrets_dir = Path("/run/secrets")
-        path_lower = self._path.lower()
-        prefix_lower = f"{path_lower}_" if path_lower else ""
-        if secrets_dir.exists() and prefix_lower:
-            for secret_file in secrets_dir.iterdir():
-                if secret_file.name.startswith(prefix_lower):
-                    key_suffix = secret_file.name[len(prefix_lower) :]
+        prefix_lower = prefix.lower()
+        if prefix_lower:
+            for secret_name in _load_secrets():
+                if secret_name.startswith(prefix_lower):
+                    key_suffix = secret_name[len(prefix_lower) :]
                     keys.add(key_suffix.lower())
         return keys
 
@@ -5,6 +5,7 @@ from typing import Any
 
 import pytest
 
+from middleware.shared.config import config_wrapper
 from middleware.shared.config.config_wrapper import ConfigWrapper, ConfigWrapperDict, ConfigWrapperList, ListType
 
 
@@ -67,25 +68,60 @@ def test_list_override_env(monkeypatch: Any, sample_dict: dict[str, Any]) -> Non
 
 
 def test_dict_override_secret(
+    monkeypatch: Any,
     tmp_path: Path,
 ) -> None:  # pylint: disable=redefined-outer-name
     """Test secret file override in ConfigWrapperDict."""
+    (tmp_path / "foo_secret").write_text("secret_value\n")
+    monkeypatch.setattr(config_wrapper, "_SECRETS_DIR", tmp_path)
+    config_wrapper._load_secrets.cache_clear()
+    try:
+        cfg = ConfigWrapperDict({}, path="foo")
+        # pylint: disable=protected-access
+        assert cfg._override_key_access("secret") == "secret_value"  # nosec
+        assert "secret" in set(cfg)  # nosec
+    finally:
+        config_wrapper._load_secrets.cache_clear()
+
+
+def test_load_secrets_lists_directory_once(monkeypatch: Any, tmp_path: Path) -> None:
+    """Test that secret file names are listed in a single scan and then served from the cache."""
+    (tmp_path / "foo_secret").write_text("secret_value\n")
+    (tmp_path / "..data").mkdir()
+    monkeypatch.setattr(config_wrapper, "_SECRETS_DIR", tmp_path)
+    config_wrapper._load_secrets.cache_clear()
+    try:
+        assert config_wrapper._load_secrets() == {"foo_secret"}  # nosec
+        (tmp_path / "foo_other").write_text("late")
+        assert "foo_other" not in config_wrapper._load_secrets()  # nosec
+        assert config_wrapper._read_secret("foo_other") is None  # nosec
+    finally:
+        config_wrapper._load_secrets.cache_clear()
+
+
+def test_read_secret_sees_rotated_value(monkeypatch: Any, tmp_path: Path) -> None:
+    """Test that secret values are read on each lookup, so rotated files are picked up."""
     secret_file = tmp_path / "foo_secret"
-    secret_file.write_text("secret_value")
-    # Patch /run/secrets to tmp_path
-    monkeypatch = pytest.MonkeyPatch()
-    original_exists = Path.exists
-    monkeypatch.setattr(Path, "exists", lambda self: original_exists(tmp_path / self.name))
-    original_read_text = Path.read_text
-    monkeypatch.setattr(
-        Path,
-        "read_text",
-        lambda self, encoding=None: original_read_text(tmp_path / self.name, encoding),
-    )
-    cfg = ConfigWrapperDict({}, path="foo")
-    # pylint: disable=protected-access
-    assert cfg._override_key_access("secret") == "secret_value"  # nosec
-    monkeypatch.undo()
+    secret_file.write_text("old")
+    monkeypatch.setattr(config_wrapper, "_SECRETS_DIR", tmp_path)
+    config_wrapper._load_secrets.cache_clear()
+    try:
+        assert config_wrapper._read_secret("foo_secret") == "old"  # nosec
+        secret_file.write_text("new")
+        assert config_wrapper._read_secret("foo_secret") == "new"  # nosec
+    finally:
+        config_wrapper._load_secrets.cache_clear()
+
+
+def test_load_secrets_missing_directory(monkeypatch: Any, tmp_path: Path) -> None:
+    """Test that a missing secrets directory yields no overrides."""
+    monkeypatch.setattr(config_wrapper, "_SECRETS_DIR", tmp_path / "missing")
+    config_wrapper._load_secrets.cache_clear()
+    try:
+        assert config_wrapper._load_secrets() == frozenset()  # nosec
+        assert config_wrapper._read_secret("foo_secret") is None  # nosec
+    finally:
+        config_wrapper._load_secrets.cache_clear()
 
 
 def test_dict_iteration_and_len(monkeypatch: Any) -> None:
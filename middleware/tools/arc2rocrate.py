@@ -1,6 +1,7 @@
 """Tool to convert ARC files to RO-Crate JSON format."""
 
 import time
+from pathlib import Path
 
 from arctrl import ARC  # type: ignore[import-untyped]
 
@@ -19,9 +20,12 @@ def arc_to_rocrate_json(arc_path: str, rocrate_output_path: str) -> None:
     end = time.perf_counter()
     print(f"Converting ARC to RO-Crate JSON took {end - start:.2f} seconds")
 
-    # Schreibe die JSON-Repräsentation in eine Datei
-    with open(rocrate_output_path, "w", encoding="utf-8") as f:
-        f.write(rocrate)
+    # Schreibe die JSON-Repräsentation in einem Rutsch als Bytes in eine Datei
+    # (arctrl bietet keine Stream-API; write_bytes umgeht den TextIOWrapper)
+    start = time.perf_counter()
+    Path(rocrate_output_path).write_bytes(rocrate.encode("utf-8"))
+    end = time.perf_counter()
+    print(f"Writing RO-Crate JSON took {end - start:.2f} seconds")
 
 
 if __name__ == "__main__":